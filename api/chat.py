@@ -13,15 +13,59 @@ Environment Variables: ANTHROPIC_API_KEY, ODDS_API_KEY
 from http.server import BaseHTTPRequestHandler
 import json
 import os
+import threading
+import time
 import anthropic
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache, wraps
+from itertools import chain
+from operator import itemgetter
+from types import MappingProxyType
+from urllib.parse import parse_qs, urlsplit
 
 # ============================================
 # API CONFIGURATION
 # ============================================
 ODDS_API_KEY = os.environ.get("ODDS_API_KEY", "7df74fcc29ab8c61a76ea382f7865283")
 ODDS_API_BASE = "https://api.the-odds-api.com/v4"
+NFL_EVENTS_URL = f"{ODDS_API_BASE}/sports/americanfootball_nfl/events"
+NFL_ODDS_URL = f"{ODDS_API_BASE}/sports/americanfootball_nfl/odds"
+EVENT_ODDS_URL = NFL_EVENTS_URL + "/{event_id}/odds"
+
+# Verbose request logging, off unless BETTORDAY_DEBUG=1
+DEBUG = os.environ.get("BETTORDAY_DEBUG", "").lower() in ("1", "true", "yes")
+
+# How long fetched Odds API data is reused across tool calls (seconds)
+EVENT_CACHE_TTL = 300
+ODDS_CACHE_TTL = 20
+
+# Player prop markets requested per Odds API call, and max concurrent calls
+PROP_MARKETS_PER_REQUEST = 10
+PROP_FETCH_WORKERS = 8
+
+# Shared session so Odds API calls reuse pooled keep-alive connections,
+# with a short retry on transient gateway errors
+ODDS_SESSION = requests.Session()
+ODDS_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=PROP_FETCH_WORKERS,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504), raise_on_status=False),
+))
+
+# Worker threads for concurrent prop fetches, kept alive across invocations
+PROP_FETCH_POOL = ThreadPoolExecutor(max_workers=PROP_FETCH_WORKERS, thread_name_prefix="props")
+
+# Tool calls from one model turn run concurrently on this pool
+TOOL_WORKERS = 4
+TOOL_POOL = ThreadPoolExecutor(max_workers=TOOL_WORKERS, thread_name_prefix="tools")
 
 # All US Sportsbooks to query
 US_BOOKMAKERS = [
@@ -81,15 +125,14 @@ PLAYER_PROP_MARKETS = {
     ]
 }
 
-# Flatten all markets into a single list for comprehensive fetching
-ALL_PLAYER_PROP_MARKETS = []
-for category, markets in PLAYER_PROP_MARKETS.items():
-    ALL_PLAYER_PROP_MARKETS.extend(markets)
+# Flatten all markets into a single tuple for comprehensive fetching
+ALL_PLAYER_PROP_MARKETS = tuple(chain.from_iterable(PLAYER_PROP_MARKETS.values()))
 
 # ============================================
 # GAME ODDS MARKETS
 # ============================================
 GAME_MARKETS = ["h2h", "spreads", "totals"]  # Moneyline, Spread, Over/Under
+GAME_MARKETS_PARAM = ",".join(GAME_MARKETS)
 
 # ============================================
 # SUPER BOWL EVENT ID (hardcoded for reliability)
@@ -98,6 +141,11 @@ SUPER_BOWL_EVENT_ID = "b64e3587d7a4cf01a568e7150a2a1aec"
 SUPER_BOWL_HOME_TEAM = "New England Patriots"
 SUPER_BOWL_AWAY_TEAM = "Seattle Seahawks"
 SUPER_BOWL_DATE = "2026-02-08T23:30:00Z"
+SUPER_BOWL_TEAMS = frozenset((SUPER_BOWL_HOME_TEAM, SUPER_BOWL_AWAY_TEAM))
+
+# The hardcoded event is used as-is unless this is set, in which case the
+# event is looked up from the Odds API events list first
+RESOLVE_SUPER_BOWL_EVENT = os.environ.get("RESOLVE_SUPER_BOWL_EVENT", "").lower() in ("1", "true", "yes")
 
 # ============================================
 # INJURED PLAYERS - EXCLUDE FROM BET RECOMMENDATIONS
@@ -105,24 +153,70 @@ SUPER_BOWL_DATE = "2026-02-08T23:30:00Z"
 INJURED_PLAYERS = [
     {"name": "Zach Charbonnet", "team": "seahawks", "status": "OUT", "injury": "Ankle - WILL NOT PLAY"},
 ]
-INJURED_PLAYER_NAMES = {p["name"].lower() for p in INJURED_PLAYERS}
+INJURED_PLAYER_NAMES = frozenset(p["name"].lower() for p in INJURED_PLAYERS)
+
+# Banner shown above player prop listings
+INJURY_BANNER = "⚠️ Injured players excluded from recommendations\n" + "".join(
+    f"🚫 {p['name']} is {p['status']} ({p['injury']})\n" for p in INJURED_PLAYERS
+) + "\n"
 
 
 # ============================================
 # THE ODDS API FUNCTIONS
 # ============================================
 
+def ttl_cache(seconds):
+    """Cache successful results per argument tuple for `seconds`."""
+    def decorator(func):
+        cache = {}
+        lock = threading.Lock()
+        # One lock per key so tools running in parallel share a single fetch
+        key_locks = defaultdict(threading.Lock)
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            # Lists (e.g. market lists) are made hashable for the key
+            key = tuple(tuple(a) if isinstance(a, list) else a for a in args)
+            key += tuple((k, tuple(v) if isinstance(v, list) else v) for k, v in sorted(kwargs.items()))
+            with lock:
+                hit = cache.get(key)
+                key_lock = key_locks[key]
+            if hit and time.monotonic() - hit[0] < seconds:
+                return hit[1]
+            
+            with key_lock:
+                # Another thread may have filled the entry while we waited
+                with lock:
+                    hit = cache.get(key)
+                now = time.monotonic()
+                if hit and now - hit[0] < seconds:
+                    return hit[1]
+                
+                value = func(*args, **kwargs)
+                # Don't hold on to errors or empty responses
+                if value and not (isinstance(value, dict) and "error" in value):
+                    with lock:
+                        cache[key] = (now, value)
+            return value
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+@ttl_cache(EVENT_CACHE_TTL)
 def get_nfl_events():
     """Get all current NFL events including Super Bowl."""
     try:
-        url = f"{ODDS_API_BASE}/sports/americanfootball_nfl/events"
-        response = requests.get(
+        url = NFL_EVENTS_URL
+        response = ODDS_SESSION.get(
             url, 
             params={"apiKey": ODDS_API_KEY}, 
             timeout=30,
             headers={"Accept": "application/json"}
         )
-        print(f"[DEBUG] NFL Events API Status: {response.status_code}")
+        if DEBUG:
+            print(f"[DEBUG] NFL Events API Status: {response.status_code}")
         if response.status_code == 200:
             return response.json()
         elif response.status_code == 401:
@@ -138,21 +232,21 @@ def get_nfl_events():
         return {"error": f"Unexpected error: {str(e)}"}
 
 
+@ttl_cache(EVENT_CACHE_TTL)
 def get_super_bowl_event():
     """Find the Super Bowl event (Seahawks vs Patriots)."""
-    # Try to fetch dynamically first
-    events = get_nfl_events()
+    if RESOLVE_SUPER_BOWL_EVENT:
+        events = get_nfl_events()
+        
+        if isinstance(events, list):
+            for event in events:
+                if {event.get("home_team"), event.get("away_team")} == SUPER_BOWL_TEAMS:
+                    return event
+        
+        # Fallback to hardcoded event ID if API fails
+        if DEBUG:
+            print("[DEBUG] Using hardcoded Super Bowl event ID")
     
-    if isinstance(events, list):
-        for event in events:
-            teams = [event.get("home_team", "").lower(), event.get("away_team", "").lower()]
-            team_str = " ".join(teams)
-            if ("seattle" in team_str or "seahawk" in team_str) and \
-               ("new england" in team_str or "patriot" in team_str):
-                return event
-    
-    # Fallback to hardcoded event ID if API fails
-    print("[DEBUG] Using hardcoded Super Bowl event ID")
     return {
         "id": SUPER_BOWL_EVENT_ID,
         "home_team": SUPER_BOWL_HOME_TEAM,
@@ -161,6 +255,7 @@ def get_super_bowl_event():
     }
 
 
+@ttl_cache(ODDS_CACHE_TTL)
 def get_live_game_odds(event_id=None):
     """
     Get current spread, total, and moneyline odds from ALL US sportsbooks.
@@ -173,29 +268,31 @@ def get_live_game_odds(event_id=None):
                 event_id = event["id"]
             else:
                 # Fall back to general NFL odds
-                url = f"{ODDS_API_BASE}/sports/americanfootball_nfl/odds"
+                url = NFL_ODDS_URL
                 params = {
                     "apiKey": ODDS_API_KEY,
                     "regions": "us,us2",
-                    "markets": ",".join(GAME_MARKETS),
+                    "markets": GAME_MARKETS_PARAM,
                     "oddsFormat": "american"
                 }
-                response = requests.get(url, params=params, timeout=30)
-                print(f"[DEBUG] NFL Odds API Status: {response.status_code}")
+                response = ODDS_SESSION.get(url, params=params, timeout=30)
+                if DEBUG:
+                    print(f"[DEBUG] NFL Odds API Status: {response.status_code}")
                 if response.status_code == 200:
                     return response.json()
                 return {"error": f"Status {response.status_code}"}
         
         # Get odds for specific event
-        url = f"{ODDS_API_BASE}/sports/americanfootball_nfl/events/{event_id}/odds"
+        url = EVENT_ODDS_URL.format(event_id=event_id)
         params = {
             "apiKey": ODDS_API_KEY,
             "regions": "us,us2",
-            "markets": ",".join(GAME_MARKETS),
+            "markets": GAME_MARKETS_PARAM,
             "oddsFormat": "american"
         }
-        response = requests.get(url, params=params, timeout=30)
-        print(f"[DEBUG] Event Odds API Status: {response.status_code}")
+        response = ODDS_SESSION.get(url, params=params, timeout=30)
+        if DEBUG:
+            print(f"[DEBUG] Event Odds API Status: {response.status_code}")
         
         if response.status_code == 200:
             return response.json()
@@ -212,6 +309,100 @@ def get_live_game_odds(event_id=None):
         return {"error": str(e)}
 
 
+def flatten_game_odds(odds_data):
+    """Flatten an event odds payload into (book, market key, name, point, price) rows."""
+    return tuple(
+        (book.get("title", "Unknown"), market.get("key"), o.get("name"), o.get("point"), o.get("price"))
+        for book in odds_data.get("bookmakers", [])
+        for market in book.get("markets", [])
+        for o in market.get("outcomes", [])
+    )
+
+
+@ttl_cache(ODDS_CACHE_TTL)
+def get_game_odds_rows(event_id):
+    """Game odds for an event as flat rows, or an error dict."""
+    odds_data = get_live_game_odds(event_id)
+    if not isinstance(odds_data, dict):
+        return {"error": "Unexpected odds response"}
+    if "error" in odds_data:
+        return odds_data
+    return flatten_game_odds(odds_data)
+
+
+def _fetch_prop_markets(event_id, markets):
+    """
+    Fetch a batch of player prop markets in one request.
+    Returns (market -> bookmakers, errors).
+    """
+    label = ",".join(markets)
+    try:
+        url = EVENT_ODDS_URL.format(event_id=event_id)
+        params = {
+            "apiKey": ODDS_API_KEY,
+            "regions": "us,us2",
+            "markets": label,
+            "oddsFormat": "american"
+        }
+        response = ODDS_SESSION.get(url, params=params, timeout=30)
+        
+        if response.status_code == 200:
+            # Split each bookmaker's multi-market entry back out per market,
+            # dropping injured players' outcomes on the way
+            by_market = {}
+            for book in response.json().get("bookmakers", []):
+                for mkt in book.get("markets", []):
+                    outcomes = mkt.get("outcomes", [])
+                    # Most markets have no injured players; only copy the ones that do
+                    if not INJURED_PLAYER_NAMES.isdisjoint(
+                        o.get("description", o.get("name", "")).lower() for o in outcomes
+                    ):
+                        outcomes = [
+                            o for o in outcomes
+                            if o.get("description", o.get("name", "")).lower() not in INJURED_PLAYER_NAMES
+                        ]
+                        mkt = {**mkt, "outcomes": outcomes}
+                    if outcomes:
+                        by_market.setdefault(mkt.get("key"), []).append({**book, "markets": [mkt]})
+            
+            if DEBUG:
+                for market, bookmakers in by_market.items():
+                    print(f"[DEBUG] Found {len(bookmakers)} books for {market}")
+            return by_market, []
+        elif response.status_code == 401:
+            return {}, [f"Invalid API key for {label}"]
+        elif response.status_code == 404:
+            # Markets not available for this event - this is normal
+            return {}, []
+        elif len(markets) > 1:
+            # One unsupported market fails the whole batch; retry them individually
+            by_market, errors = {}, []
+            for market in markets:
+                found, failed = _fetch_prop_markets(event_id, [market])
+                by_market.update(found)
+                errors.extend(failed)
+            return by_market, errors
+        return {}, [f"{label}: status {response.status_code}"]
+    
+    except requests.exceptions.Timeout:
+        return {}, [f"{label}: timeout"]
+    except requests.exceptions.ConnectionError:
+        return {}, [f"{label}: connection error"]
+    except Exception as e:
+        return {}, [f"{label}: {str(e)}"]
+
+
+@lru_cache(maxsize=64)
+def prop_market_batches(markets):
+    """Split a tuple of markets into PROP_MARKETS_PER_REQUEST-sized batches."""
+    return tuple(markets[i:i + PROP_MARKETS_PER_REQUEST] for i in range(0, len(markets), PROP_MARKETS_PER_REQUEST))
+
+
+# (event_id, market) -> (fetched_at, bookmakers), shared by every prop query
+PROP_MARKET_CACHE = {}
+PROP_MARKET_CACHE_LOCK = threading.Lock()
+
+
 def get_all_player_props(event_id, markets=None, category=None):
     """
     Get ALL player props from ALL sportsbooks.
@@ -222,7 +413,7 @@ def get_all_player_props(event_id, markets=None, category=None):
         category: Optional category name ('passing', 'rushing', 'receiving', 'touchdowns', etc.)
     
     Returns:
-        Dict with market -> bookmaker data
+        Dict with market -> bookmaker data (injured players excluded)
     """
     if markets is None:
         if category and category in PLAYER_PROP_MARKETS:
@@ -234,38 +425,27 @@ def get_all_player_props(event_id, markets=None, category=None):
     all_props = {}
     errors = []
     
+    # Markets fetched recently (by this or any other query) are reused per market
+    now = time.monotonic()
+    fetched = {}
+    with PROP_MARKET_CACHE_LOCK:
+        for market in markets:
+            hit = PROP_MARKET_CACHE.get((event_id, market))
+            if hit and now - hit[0] < ODDS_CACHE_TTL:
+                fetched[market] = hit[1]
+    missing = tuple(market for market in markets if market not in fetched)
+    
+    # Request the rest in batches, with the batches fetched concurrently
+    for by_market, batch_errors in PROP_FETCH_POOL.map(lambda batch: _fetch_prop_markets(event_id, batch), prop_market_batches(missing)):
+        fetched.update(by_market)
+        errors.extend(batch_errors)
+        with PROP_MARKET_CACHE_LOCK:
+            for market, bookmakers in by_market.items():
+                PROP_MARKET_CACHE[(event_id, market)] = (now, bookmakers)
+    
     for market in markets:
-        try:
-            url = f"{ODDS_API_BASE}/sports/americanfootball_nfl/events/{event_id}/odds"
-            params = {
-                "apiKey": ODDS_API_KEY,
-                "regions": "us,us2",
-                "markets": market,
-                "oddsFormat": "american"
-            }
-            response = requests.get(url, params=params, timeout=30)
-            
-            if response.status_code == 200:
-                data = response.json()
-                bookmakers = data.get("bookmakers", [])
-                
-                if bookmakers:
-                    all_props[market] = bookmakers
-                    print(f"[DEBUG] Found {len(bookmakers)} books for {market}")
-            elif response.status_code == 401:
-                errors.append(f"Invalid API key for {market}")
-            elif response.status_code == 404:
-                # Market not available for this event - this is normal
-                pass
-            else:
-                errors.append(f"{market}: status {response.status_code}")
-                    
-        except requests.exceptions.Timeout:
-            errors.append(f"{market}: timeout")
-        except requests.exceptions.ConnectionError:
-            errors.append(f"{market}: connection error")
-        except Exception as e:
-            errors.append(f"{market}: {str(e)}")
+        if fetched.get(market):
+            all_props[market] = fetched[market]
     
     if errors and not all_props:
         print(f"[DEBUG] Prop fetch errors: {errors}")
@@ -293,6 +473,17 @@ def get_touchdown_props(event_id):
     return get_all_player_props(event_id, category="touchdowns")
 
 
+def iter_player_prop_outcomes(props_data, market, player_name):
+    """Yield (book name, outcome) for every outcome in a market matching the player."""
+    player_key = player_name.lower()
+    for bookmaker in props_data.get(market, []):
+        book_name = bookmaker.get("title", "Unknown")
+        for mkt in bookmaker.get("markets", []):
+            for outcome in mkt.get("outcomes", []):
+                if player_key in outcome.get("description", "").lower():
+                    yield book_name, outcome
+
+
 def get_best_line_for_prop(props_data, market, player_name, over_under="Over"):
     """
     Find the best available line across all sportsbooks for a specific player prop.
@@ -301,25 +492,14 @@ def get_best_line_for_prop(props_data, market, player_name, over_under="Over"):
     best_book = None
     best_line = None
     
-    if market not in props_data:
-        return None
-    
-    for bookmaker in props_data[market]:
-        book_name = bookmaker.get("title", "Unknown")
-        for mkt in bookmaker.get("markets", []):
-            for outcome in mkt.get("outcomes", []):
-                desc = outcome.get("description", "").lower()
-                name = outcome.get("name", "")
-                
-                if player_name.lower() in desc:
-                    if over_under.lower() in name.lower():
-                        odds = outcome.get("price", -99999)
-                        line = outcome.get("point")
-                        
-                        if odds > best_odds:
-                            best_odds = odds
-                            best_book = book_name
-                            best_line = line
+    side_key = over_under.lower()
+    for book_name, outcome in iter_player_prop_outcomes(props_data, market, player_name):
+        if side_key in outcome.get("name", "").lower():
+            odds = outcome.get("price", -99999)
+            if odds > best_odds:
+                best_odds = odds
+                best_book = book_name
+                best_line = outcome.get("point")
     
     if best_book:
         return {
@@ -336,65 +516,22 @@ def compare_odds_across_books(props_data, market, player_name):
     Get all odds from all sportsbooks for a specific player's prop.
     Useful for line shopping.
     """
-    all_odds = []
-    
-    if market not in props_data:
-        return all_odds
-    
-    for bookmaker in props_data[market]:
-        book_name = bookmaker.get("title", "Unknown")
-        for mkt in bookmaker.get("markets", []):
-            for outcome in mkt.get("outcomes", []):
-                desc = outcome.get("description", "").lower()
-                if player_name.lower() in desc:
-                    all_odds.append({
-                        "book": book_name,
-                        "line": outcome.get("point"),
-                        "over_under": outcome.get("name"),
-                        "odds": outcome.get("price"),
-                        "formatted_odds": format_odds(outcome.get("price", 0))
-                    })
+    all_odds = [
+        {
+            "book": book_name,
+            "line": outcome.get("point"),
+            "over_under": outcome.get("name"),
+            "odds": outcome.get("price"),
+            "formatted_odds": format_odds(outcome.get("price", 0))
+        }
+        for book_name, outcome in iter_player_prop_outcomes(props_data, market, player_name)
+    ]
     
     # Sort by odds (best first)
-    all_odds.sort(key=lambda x: x["odds"], reverse=True)
+    all_odds.sort(key=itemgetter("odds"), reverse=True)
     return all_odds
 
 
-def filter_injured_players(props_data):
-    """Filter out injured players from prop data."""
-    filtered = {}
-    
-    for market, bookmakers in props_data.items():
-        filtered[market] = []
-        
-        for book in bookmakers:
-            filtered_book = {
-                "key": book.get("key"),
-                "title": book.get("title"),
-                "markets": []
-            }
-            
-            for mkt in book.get("markets", []):
-                filtered_outcomes = []
-                
-                for outcome in mkt.get("outcomes", []):
-                    player_name = outcome.get("description", outcome.get("name", ""))
-                    
-                    if player_name.lower() not in INJURED_PLAYER_NAMES:
-                        filtered_outcomes.append(outcome)
-                
-                if filtered_outcomes:
-                    filtered_book["markets"].append({
-                        "key": mkt.get("key"),
-                        "outcomes": filtered_outcomes
-                    })
-            
-            if filtered_book["markets"]:
-                filtered[market].append(filtered_book)
-    
-    return filtered
-
-
 def format_odds(price):
     """Format odds in American format."""
     if price is None:
@@ -402,46 +539,59 @@ def format_odds(price):
     return f"+{price}" if price >= 0 else str(price)
 
 
+@lru_cache(maxsize=None)
+def prop_market_label(market):
+    """Display name for a prop market key, e.g. player_pass_yds -> Pass Yds."""
+    return market.replace("player_", "").replace("_", " ").title()
+
+
+# Books shown per player in the props summary
+PROPS_SUMMARY_BOOKS = 3
+
+
 def format_props_summary(props_data, player_filter=None):
     """Format player props for readable display."""
     if not props_data:
         return "No player props available."
     
     output = []
+    player_key = player_filter.lower() if player_filter else None
     
     for market, bookmakers in props_data.items():
-        market_display = market.replace("player_", "").replace("_", " ").title()
-        output.append(f"\n**{market_display}:**")
+        output.append(f"\n**{prop_market_label(market)}:**")
         
-        # Organize by player
-        players = {}
+        # Organize by player; rows are kept raw and only the shown ones formatted
+        players = defaultdict(list)
         for book in bookmakers:
             book_name = book.get("title", "Unknown")
             for mkt in book.get("markets", []):
                 for outcome in mkt.get("outcomes", []):
                     player = outcome.get("description", "Unknown")
                     
-                    if player_filter and player_filter.lower() not in player.lower():
+                    if player_key and player_key not in player.lower():
                         continue
                     
-                    if player not in players:
-                        players[player] = []
-                    
-                    players[player].append({
-                        "book": book_name,
-                        "line": outcome.get("point"),
-                        "ou": outcome.get("name"),
-                        "odds": format_odds(outcome.get("price"))
-                    })
+                    players[player].append((book_name, outcome))
         
         for player, lines in sorted(players.items()):
             output.append(f"\n  {player}:")
-            for line in lines[:3]:  # Show top 3 books per player
-                output.append(f"    • {line['book']}: {line['line']} {line['ou']} ({line['odds']})")
+            output.extend(
+                f"    • {book_name}: {o.get('point')} {o.get('name')} ({format_odds(o.get('price'))})"
+                for book_name, o in lines[:PROPS_SUMMARY_BOOKS]
+            )
     
     return "\n".join(output)
 
 
+def freeze(data):
+    """Recursively wrap nested dicts in read-only mapping proxies and lists in tuples."""
+    if isinstance(data, dict):
+        return MappingProxyType({key: freeze(value) for key, value in data.items()})
+    if isinstance(data, list):
+        return tuple(freeze(value) for value in data)
+    return data
+
+
 # ============================================
 # BIGDATABALL DATA - 2025 NFL SEASON
 # ============================================
@@ -452,10 +602,8 @@ SUPERBOWL_DATA = {
             "name": "Seattle Seahawks",
             "record": "16-3",
             "ats": "14-5",
-            "ats_pct": 73.7,
             "overs": 11,
             "unders": 8,
-            "over_pct": 57.9,
             "ppg": 29.2,
             "ppg_allowed": 17.1,
             "avg_yards": 350.0,
@@ -467,16 +615,15 @@ SUPERBOWL_DATA = {
             "road_record": "8-1",
             "home_ats": "6-4",
             "road_ats": "8-1",
-            "scoring": {"q1": 7.0, "q2": 7.9, "q3": 7.6, "q4": 6.3, "first_half": 14.9, "second_half": 13.9},
+            "bye_week": 10,
+            "scoring": {"q1": 7.0, "q2": 7.9, "q3": 7.6, "q4": 6.3},
         },
         "patriots": {
             "name": "New England Patriots",
             "record": "15-4",
             "ats": "14-5",
-            "ats_pct": 73.7,
             "overs": 12,
             "unders": 8,
-            "over_pct": 60.0,
             "ppg": 27.8,
             "ppg_allowed": 18.2,
             "avg_yards": 345.0,
@@ -488,7 +635,8 @@ SUPERBOWL_DATA = {
             "road_record": "9-0",
             "home_ats": "5-5",
             "road_ats": "9-0",
-            "scoring": {"q1": 6.8, "q2": 6.6, "q3": 7.2, "q4": 7.2, "first_half": 13.4, "second_half": 14.4},
+            "bye_week": 14,
+            "scoring": {"q1": 6.8, "q2": 6.6, "q3": 7.2, "q4": 7.2},
         }
     },
     "players": {
@@ -557,7 +705,6 @@ SUPERBOWL_DATA = {
             {"wk": 7, "opp": "ATL", "result": "W 34-14", "ats": "W", "ou": "U 49", "score": "34-14"},
             {"wk": 8, "opp": "BUF", "result": "L 23-31", "ats": "L", "ou": "O 48.5", "score": "23-31"},
             {"wk": 9, "opp": "@LAR", "result": "W 26-20", "ats": "W", "ou": "U 49.5", "score": "26-20"},
-            {"wk": 10, "opp": "BYE", "result": "-", "ats": "-", "ou": "-", "score": "-"},
             {"wk": 11, "opp": "SF", "result": "W 20-17", "ats": "L", "ou": "U 48", "score": "20-17"},
             {"wk": 12, "opp": "@ARI", "result": "W 16-6", "ats": "W", "ou": "U 47.5", "score": "16-6"},
             {"wk": 13, "opp": "NYJ", "result": "W 35-14", "ats": "W", "ou": "O 43", "score": "35-14"},
@@ -584,7 +731,6 @@ SUPERBOWL_DATA = {
             {"wk": 11, "opp": "@LAR", "result": "W 28-22", "ats": "W", "ou": "O 45.5", "score": "28-22"},
             {"wk": 12, "opp": "@MIA", "result": "W 34-15", "ats": "W", "ou": "O 44", "score": "34-15"},
             {"wk": 13, "opp": "IND", "result": "L 17-24", "ats": "L", "ou": "O 39.5", "score": "17-24"},
-            {"wk": 14, "opp": "BYE", "result": "-", "ats": "-", "ou": "-", "score": "-"},
             {"wk": 15, "opp": "@ARI", "result": "W 30-17", "ats": "W", "ou": "O 43.5", "score": "30-17"},
             {"wk": 16, "opp": "BUF", "result": "L 22-24", "ats": "L", "ou": "U 48.5", "score": "22-24"},
             {"wk": 17, "opp": "@LAC", "result": "L 17-40", "ats": "L", "ou": "O 45.5", "score": "17-40"},
@@ -596,30 +742,221 @@ SUPERBOWL_DATA = {
     }
 }
 
-# Super Bowl betting trends
-SUPER_BOWL_TRENDS = {
-    "underdog_ats": {
-        "record": "11-3 ATS in last 14 Super Bowls",
-        "avg_cover": "+7.2 points",
-        "note": "Patriots are 3.5-point underdogs"
-    },
-    "under_trend": {
-        "record": "12-5-2 to the UNDER in last 19 Super Bowls",
-        "avg_total": "47.5",
-        "note": "Sharp money often on UNDER"
-    },
-    "first_td_trends": {
-        "running_backs": "Have scored 8 of last 12 first TDs",
-        "tight_ends": "3 first TDs in last 10 Super Bowls",
-        "note": "RBs and TEs are value plays"
-    },
-    "referee": {
-        "name": "Shawn Smith",
-        "underdogs": "68-55-6 ATS (55.3%) since 2018",
-        "overs": "5-2 in playoffs"
-    }
+def _pct(wins, losses):
+    """Win percentage rounded to one decimal."""
+    return round(100 * wins / (wins + losses), 1)
+
+
+# Percentages and half splits are derived from the raw counts so they can't drift
+for _team in SUPERBOWL_DATA["teams"].values():
+    _team["ats_pct"] = _pct(*map(int, _team["ats"].split("-")))
+    _team["over_pct"] = _pct(_team["overs"], _team["unders"])
+    _scoring = _team["scoring"]
+    _scoring["first_half"] = round(_scoring["q1"] + _scoring["q2"], 1)
+    _scoring["second_half"] = round(_scoring["q3"] + _scoring["q4"], 1)
+
+# Season data is read-only reference data once the derived fields are in
+SUPERBOWL_DATA = freeze(SUPERBOWL_DATA)
+
+# Flattened (team_key, name_key, player) roster so lookups make a single pass
+ROSTER = [
+    (team_key, player["name"].lower(), player)
+    for team_key, players in SUPERBOWL_DATA["players"].items()
+    for player in players
+]
+
+
+def _first_roster_match(fragment):
+    """First roster row whose lowercased name contains fragment."""
+    return next(row for row in ROSTER if fragment in row[1])
+
+
+# Nicknames accepted wherever a player name is looked up
+PLAYER_NICKNAMES = {
+    "jsn": "Jaxon Smith-Njigba",
+    "kwiii": "Kenneth Walker III",
 }
 
+# Full names and name tokens -> the row a substring scan of ROSTER would find first, plus nicknames
+PLAYER_INDEX = {key: _first_roster_match(key) for row in ROSTER for key in (row[1], *row[1].split())}
+PLAYER_INDEX.update((nickname, PLAYER_INDEX[name.lower()]) for nickname, name in PLAYER_NICKNAMES.items())
+
+
+def format_player_stats(team_key, player):
+    """Season stats and per-game averages for a player."""
+    is_injured = player.get("status") == "OUT"
+    pos = player["pos"]
+    avgs = player["avgs"]
+    
+    parts = [f"**{player['name']}** ({pos}) - "]
+    parts.append(f"{SUPERBOWL_DATA['teams'][team_key]['name']}\n\n")
+    
+    if is_injured:
+        parts.append(f"🚫 **STATUS: OUT** - {player.get('injury', 'Injured')}\n")
+        parts.append("⚠️ DO NOT BET ON THIS PLAYER\n\n")
+    
+    parts.append(f"Games Played: {player.get('games', 'N/A')}\n\n")
+    
+    if pos == "QB":
+        parts.append(f"**PASSING:**\n")
+        parts.append(f"• Yards: {player.get('pass_yds', 0):,} ({avgs.get('pass_yds', 0)}/game)\n")
+        parts.append(f"• TD: {player.get('pass_td', 0)} ({avgs.get('pass_td', 0)}/game)\n")
+        parts.append(f"• INT: {player.get('pass_int', 0)}\n")
+        parts.append(f"• Comp%: {player.get('comp_pct', 0)}%\n")
+        parts.append(f"• Completions/game: {avgs.get('completions', 0)}\n")
+        parts.append(f"• Attempts/game: {avgs.get('attempts', 0)}\n\n")
+        parts.append(f"**RUSHING:**\n")
+        parts.append(f"• Yards: {player.get('rush_yds', 0)} ({avgs.get('rush_yds', 0)}/game)\n")
+        
+    elif pos == "RB":
+        parts.append(f"**RUSHING:**\n")
+        parts.append(f"• Yards: {player.get('rush_yds', 0):,} ({avgs.get('rush_yds', 0)}/game)\n")
+        parts.append(f"• TD: {player.get('rush_td', 0)}\n")
+        parts.append(f"• Attempts/game: {avgs.get('rush_att', 0)}\n\n")
+        parts.append(f"**RECEIVING:**\n")
+        parts.append(f"• Receptions: {player.get('rec', 0)} ({avgs.get('receptions', 0)}/game)\n")
+        parts.append(f"• Yards: {player.get('rec_yds', 0)} ({avgs.get('rec_yds', 0)}/game)\n")
+        
+    elif pos in ("WR", "TE"):
+        parts.append(f"**RECEIVING:**\n")
+        parts.append(f"• Receptions: {player.get('rec', 0)} ({avgs.get('receptions', 0)}/game)\n")
+        parts.append(f"• Yards: {player.get('rec_yds', 0):,} ({avgs.get('rec_yds', 0)}/game)\n")
+        parts.append(f"• TD: {player.get('rec_td', 0)}\n")
+        parts.append(f"• Targets/game: {avgs.get('targets', 'N/A')}\n")
+        if player.get('red_zone_targets'):
+            parts.append(f"• Red Zone Targets: {player['red_zone_targets']}\n")
+    
+    if player.get('first_tds'):
+        parts.append(f"\n• First TDs this season: {player['first_tds']}\n")
+    
+    return "".join(parts)
+
+
+# Player stats are static, so each player's block is rendered once
+PLAYER_STATS_REPORTS = {name_key: format_player_stats(team_key, player) for team_key, name_key, player in ROSTER}
+
+
+# Team stats report layout; filled from a team's SUPERBOWL_DATA entry
+TEAM_STATS_TEMPLATE = (
+    "**{name}** ({record})\n\n"
+    "**BETTING RECORD:**\n"
+    "• ATS: {ats} ({ats_pct}%)\n"
+    "• O/U: {overs} overs, {unders} unders ({over_pct}% over)\n"
+    "• Home: {home_record} ({home_ats} ATS)\n"
+    "• Road: {road_record} ({road_ats} ATS)\n\n"
+    "**TEAM STATS:**\n"
+    "• PPG: {ppg} scored, {ppg_allowed} allowed\n"
+    "• Yards: {avg_yards}/g ({avg_rush_yards} rush, {avg_pass_yards} pass)\n"
+    "• 3rd Down: {third_down_pct}%\n"
+    "• Turnovers: {turnovers_pg}/game\n\n"
+    "**SCORING BY QUARTER:**\n"
+    "• Q1: {scoring[q1]} | Q2: {scoring[q2]} | Q3: {scoring[q3]} | Q4: {scoring[q4]}\n"
+    "• 1H: {scoring[first_half]} | 2H: {scoring[second_half]}\n\n"
+    "**GAME LOG:**\n"
+)
+TEAM_GAME_LOG_TEMPLATE = "Wk {wk}: {opp} {result} | ATS: {ats} | {ou}\n"
+
+
+def format_team_stats(team_key):
+    """Season stats, betting record and last 10 games for a team."""
+    parts = [TEAM_STATS_TEMPLATE.format_map(SUPERBOWL_DATA["teams"][team_key])]
+    parts.extend(TEAM_GAME_LOG_TEMPLATE.format_map(g) for g in SUPERBOWL_DATA["game_logs"][team_key][-10:])
+    return "".join(parts)
+
+
+# Team stats are static, so each team's report is rendered once
+TEAM_STATS_REPORTS = {team_key: format_team_stats(team_key) for team_key in SUPERBOWL_DATA["teams"]}
+
+# Super Bowl betting trends
+@dataclass(slots=True, frozen=True)
+class UnderdogATS:
+    record: str
+    avg_cover: str
+    note: str
+
+
+@dataclass(slots=True, frozen=True)
+class UnderTrend:
+    record: str
+    avg_total: str
+    note: str
+
+
+@dataclass(slots=True, frozen=True)
+class FirstTDTrends:
+    running_backs: str
+    tight_ends: str
+    note: str
+
+
+@dataclass(slots=True, frozen=True)
+class Referee:
+    name: str
+    underdogs: str
+    overs: str
+
+
+@dataclass(slots=True, frozen=True)
+class Trends:
+    underdog_ats: UnderdogATS
+    under_trend: UnderTrend
+    first_td_trends: FirstTDTrends
+    referee: Referee
+
+
+SUPER_BOWL_TRENDS = Trends(
+    underdog_ats=UnderdogATS(
+        record="11-3 ATS in last 14 Super Bowls",
+        avg_cover="+7.2 points",
+        note="Patriots are 3.5-point underdogs"
+    ),
+    under_trend=UnderTrend(
+        record="12-5-2 to the UNDER in last 19 Super Bowls",
+        avg_total="47.5",
+        note="Sharp money often on UNDER"
+    ),
+    first_td_trends=FirstTDTrends(
+        running_backs="Have scored 8 of last 12 first TDs",
+        tight_ends="3 first TDs in last 10 Super Bowls",
+        note="RBs and TEs are value plays"
+    ),
+    referee=Referee(
+        name="Shawn Smith",
+        underdogs="68-55-6 ATS (55.3%) since 2018",
+        overs="5-2 in playoffs"
+    )
+)
+
+
+def format_betting_trends(trends):
+    """Render the Super Bowl betting trends report."""
+    parts = ["**SUPER BOWL BETTING TRENDS**\n\n"]
+    
+    parts.append("**UNDERDOG ATS:**\n")
+    parts.append(f"• {trends.underdog_ats.record}\n")
+    parts.append(f"• Average cover margin: {trends.underdog_ats.avg_cover}\n")
+    parts.append(f"• Note: {trends.underdog_ats.note}\n\n")
+    
+    parts.append("**OVER/UNDER:**\n")
+    parts.append(f"• {trends.under_trend.record}\n")
+    parts.append(f"• Average total: {trends.under_trend.avg_total}\n")
+    parts.append(f"• Note: {trends.under_trend.note}\n\n")
+    
+    parts.append("**FIRST TD SCORER:**\n")
+    parts.append(f"• RBs: {trends.first_td_trends.running_backs}\n")
+    parts.append(f"• TEs: {trends.first_td_trends.tight_ends}\n")
+    parts.append(f"• {trends.first_td_trends.note}\n\n")
+    
+    parts.append(f"**REFEREE ({trends.referee.name}):**\n")
+    parts.append(f"• Underdog record: {trends.referee.underdogs}\n")
+    parts.append(f"• Playoff O/U: {trends.referee.overs}\n")
+    
+    return "".join(parts)
+
+
+# The trends are static, so the report is rendered once
+BETTING_TRENDS_REPORT = format_betting_trends(SUPER_BOWL_TRENDS)
+
 
 # ============================================
 # ============================================
@@ -1027,6 +1364,75 @@ PLAY_TENDENCIES = {
 }
 
 
+# Tendencies are read-only reference data
+PLAY_TENDENCIES = freeze(PLAY_TENDENCIES)
+
+
+def format_play_tendencies(team_key):
+    """Render a team's play-by-play tendencies report."""
+    t = PLAY_TENDENCIES[team_key]
+    team_name = SUPERBOWL_DATA["teams"][team_key]["name"]
+    
+    parts = [f"**{team_name} - Play-by-Play Tendencies**\n\n"]
+    
+    # Overall
+    parts.append(f"**OVERALL ({t['total_plays']} plays):**\n")
+    parts.append(f"• Run: {t['run_pct']}% ({t['run_plays']} plays)\n")
+    parts.append(f"• Pass: {t['pass_pct']}% ({t['pass_plays']} plays)\n\n")
+    
+    # By Down
+    parts.append("**BY DOWN:**\n")
+    for down, data in t["by_down"].items():
+        parts.append(f"• {down}: Run {data['run']}%, Pass {data['pass']}% (avg {data['avg_yards']} yds)\n")
+    parts.append("\n")
+    
+    # Red Zone
+    rz = t["red_zone"]
+    parts.append(f"**RED ZONE ({rz['total_plays']} plays):**\n")
+    parts.append(f"• Run: {rz['run_pct']}%, Pass: {rz['pass_pct']}%\n")
+    parts.append(f"• TD conversion: {rz['td_pct']}%\n\n")
+    
+    # Goal Line
+    gl = t["goal_line"]
+    parts.append(f"**GOAL LINE ({gl['total_plays']} plays):**\n")
+    parts.append(f"• Run: {gl['run_pct']}%, Pass: {gl['pass_pct']}%\n")
+    parts.append(f"• TD conversion: {gl['td_pct']}%\n\n")
+    
+    # Situational
+    sit = t["situational"]
+    parts.append("**SITUATIONAL:**\n")
+    parts.append(f"• When Trailing: Run {sit['trailing']['run']}%, Pass {sit['trailing']['pass']}%\n")
+    parts.append(f"• When Leading: Run {sit['leading']['run']}%, Pass {sit['leading']['pass']}%\n")
+    parts.append(f"• Close Game (±7): Run {sit['close_game']['run']}%, Pass {sit['close_game']['pass']}%\n\n")
+    
+    # Pass Depth
+    pd = t["pass_depth"]
+    parts.append(f"**PASS DEPTH:**\n")
+    parts.append(f"• Short: {pd['short']}%, Deep: {pd['deep']}%\n\n")
+    
+    # Run Direction
+    rd = t["run_direction"]
+    parts.append(f"**RUN DIRECTION:**\n")
+    parts.append(f"• Left: {rd['left']}%, Middle: {rd['middle']}%, Right: {rd['right']}%\n\n")
+    
+    # Target Share
+    parts.append("**TARGET SHARE:**\n")
+    for player, share in t["target_share"].items():
+        parts.append(f"• {player}: {share}%\n")
+    parts.append("\n")
+    
+    # Explosive Plays
+    exp = t["explosive_plays"]
+    parts.append(f"**EXPLOSIVE PLAYS (20+ yards):**\n")
+    parts.append(f"• Total: {exp['total']} (Run: {exp['run_20plus']}, Pass: {exp['pass_20plus']})\n")
+    
+    return "".join(parts)
+
+
+# Tendencies never change at runtime, so render each team's report once
+PLAY_TENDENCY_REPORTS = {team_key: format_play_tendencies(team_key) for team_key in PLAY_TENDENCIES}
+
+
 # ============================================
 # TEAM GAME LOGS WITH QUARTER SCORING (FROM BIGDATABALL CSV)
 # ============================================
@@ -1115,73 +1521,69 @@ def format_american_odds(odds):
         return "N/A"
     return f"+{odds}" if odds > 0 else str(odds)
 
+# stat_type -> (game log key, parser for that key's stat line)
+STAT_PARSERS = {
+    "pass_yds": ("pass", lambda s: int(s.split(',')[1].strip().replace(' yds', ''))),
+    "pass_tds": ("pass", lambda s: int(s.split(',')[2].strip().replace(' TD', ''))),
+    "pass_attempts": ("pass", lambda s: int(s.split(',')[0].split('/')[1])),
+    "completions": ("pass", lambda s: int(s.split(',')[0].split('/')[0])),
+    "interceptions": ("pass", lambda s: int(s.split(',')[3].strip().replace(' INT', ''))),
+    "rush_yds": ("rush", lambda s: int(s.split(',')[1].strip().replace(' yds', ''))),
+    "rush_att": ("rush", lambda s: int(s.split(',')[0].strip().replace(' att', ''))),
+    "receptions": ("rec", lambda s: int(s.split(',')[0].strip().replace(' rec', ''))),
+    "rec_yds": ("rec", lambda s: int(s.split(',')[1].strip().replace(' yds', ''))),
+    # Format: "8 rec, 124 yds, 0 TD (13 tgt)"
+    "targets": ("rec", lambda s: int(s.split('(')[1].replace(' tgt)', '').replace('tgt)', ''))),
+}
+
 def parse_player_stat(log, stat_type):
     """Extract a specific stat from a player's game log."""
-    if stat_type == "pass_yds":
-        if 'pass' in log:
-            parts = log['pass'].split(',')
-            return int(parts[1].strip().replace(' yds', ''))
-    elif stat_type == "pass_tds":
-        if 'pass' in log:
-            parts = log['pass'].split(',')
-            return int(parts[2].strip().replace(' TD', ''))
-    elif stat_type == "pass_attempts":
-        if 'pass' in log:
-            comp_att = log['pass'].split(',')[0]
-            return int(comp_att.split('/')[1])
-    elif stat_type == "completions":
-        if 'pass' in log:
-            comp_att = log['pass'].split(',')[0]
-            return int(comp_att.split('/')[0])
-    elif stat_type == "interceptions":
-        if 'pass' in log:
-            parts = log['pass'].split(',')
-            return int(parts[3].strip().replace(' INT', ''))
-    elif stat_type == "rush_yds":
-        if 'rush' in log:
-            parts = log['rush'].split(',')
-            return int(parts[1].strip().replace(' yds', ''))
-    elif stat_type == "rush_att":
-        if 'rush' in log:
-            parts = log['rush'].split(',')
-            return int(parts[0].strip().replace(' att', ''))
-    elif stat_type == "receptions":
-        if 'rec' in log:
-            parts = log['rec'].split(',')
-            rec_part = parts[0].strip()
-            return int(rec_part.replace(' rec', ''))
-    elif stat_type == "rec_yds":
-        if 'rec' in log:
-            parts = log['rec'].split(',')
-            return int(parts[1].strip().replace(' yds', ''))
-    elif stat_type == "targets":
-        if 'rec' in log:
-            # Format: "8 rec, 124 yds, 0 TD (13 tgt)"
-            tgt_part = log['rec'].split('(')[1].replace(' tgt)', '').replace('tgt)', '')
-            return int(tgt_part)
+    parser = STAT_PARSERS.get(stat_type)
+    if parser is None:
+        return None
+    key, parse = parser
+    if key in log:
+        return parse(log[key])
     return None
 
-def calculate_hit_rate(player_logs, stat_type, line):
-    """Calculate how often a player hits over a line."""
-    values = []
-    for log in player_logs:
-        val = parse_player_stat(log, stat_type)
-        if val is not None:
-            values.append(val)
+STAT_TYPES = tuple(STAT_PARSERS)
+
+# Game log strings parsed once at import: player -> stat_type -> int16 values
+PLAYER_STAT_VALUES = {
+    name: {
+        stat_type: array("h", (v for v in (parse_player_stat(log, stat_type) for log in logs) if v is not None))
+        for stat_type in STAT_TYPES
+    }
+    for name, logs in PLAYER_GAME_LOGS.items()
+}
+
+# Line-independent aggregates: player -> stat_type -> (games, avg, sorted values)
+PLAYER_STAT_SUMMARY = {
+    name: {
+        stat_type: (len(values), round(sum(values) / len(values), 1), sorted(values))
+        for stat_type, values in stats.items() if values
+    }
+    for name, stats in PLAYER_STAT_VALUES.items()
+}
+
+@lru_cache(maxsize=512)
+def calculate_hit_rate(player_name, stat_type, line):
+    """Calculate how often a player hits over a line (cached; callers must not mutate)."""
+    summary = PLAYER_STAT_SUMMARY[player_name].get(stat_type)
     
-    if not values:
+    if summary is None:
         return None
     
-    over_count = sum(1 for v in values if v > line)
-    under_count = len(values) - over_count
-    over_pct = over_count / len(values)
-    under_pct = under_count / len(values)
-    avg = sum(values) / len(values)
+    games, avg, ordered = summary
+    over_count = games - bisect_right(ordered, line)
+    under_count = games - over_count
+    over_pct = over_count / games
+    under_pct = under_count / games
     
     return {
-        "values": values,
-        "games": len(values),
-        "avg": round(avg, 1),
+        "values": PLAYER_STAT_VALUES[player_name][stat_type],
+        "games": games,
+        "avg": avg,
         "over_count": over_count,
         "under_count": under_count,
         "over_pct": round(over_pct * 100, 1),
@@ -1420,683 +1822,562 @@ Use this when someone asks about prop value, implied probability, or whether a b
 # TOOL EXECUTION
 # ============================================
 
-def execute_tool(tool_name, tool_input):
-    """Execute a tool and return results."""
+# Lowercase name -> PLAYER_GAME_LOGS key, in log order
+GAME_LOG_NAME_INDEX = {name.lower(): name for name in PLAYER_GAME_LOGS}
+GAME_LOG_PLAYERS = ", ".join(PLAYER_GAME_LOGS)
+
+
+def find_game_log_player(player_name):
+    """Resolve a full, partial or nickname to a PLAYER_GAME_LOGS key (or None)."""
+    player_name = player_name.lower()
+    if player_name in GAME_LOG_NAME_INDEX:
+        return GAME_LOG_NAME_INDEX[player_name]
+    for name_key, name in GAME_LOG_NAME_INDEX.items():
+        if player_name in name_key or name_key in player_name:
+            return name
+    for nickname, name in PLAYER_NICKNAMES.items():
+        if nickname in player_name:
+            return name
+    return None
+
+
+def format_game_log_entry(g):
+    """One week of a player's game log."""
+    lines = [f"**Week {g['wk']}** vs {g.get('opp', '')}\n"]
+    if "pass" in g:
+        lines.append(f"  Pass: {g['pass']}\n")
+    if "rush" in g:
+        lines.append(f"  Rush: {g['rush']}\n")
+    if "rec" in g:
+        lines.append(f"  Rec: {g['rec']}\n")
+    lines.append("\n")
+    return "".join(lines)
+
+
+# Name fragments that identify each team, plus exact abbreviations
+TEAM_NAME_FRAGMENTS = {
+    "seahawks": ("seahawk", "seattle"),
+    "patriots": ("patriot", "new england"),
+}
+TEAM_ABBREVIATIONS = {"sea": "seahawks", "ne": "patriots"}
+
+
+def resolve_team_key(team):
+    """Map a user-supplied team name to 'seahawks' or 'patriots', or None."""
+    team = team.lower()
+    if team in TEAM_ABBREVIATIONS:
+        return TEAM_ABBREVIATIONS[team]
+    for team_key, fragments in TEAM_NAME_FRAGMENTS.items():
+        if any(fragment in team for fragment in fragments):
+            return team_key
+    return None
+
+
+# Markdown table header for compare_lines
+COMPARE_LINES_HEADER = (
+    "| Sportsbook | Line | Over/Under | Odds |\n"
+    "|------------|------|------------|------|\n"
+)
+
+
+# Rows shown per market in the live odds display
+LIVE_ODDS_MAX_ROWS = 10
+
+
+def _tool_get_live_game_odds(tool_input):
+    """Current spread, total and moneyline from every book."""
+    event = get_super_bowl_event()
     
-    if tool_name == "get_live_game_odds":
-        event = get_super_bowl_event()
-        
-        if not event:
-            return "Unable to find Super Bowl event. The game may not be listed yet."
-        
-        odds_data = get_live_game_odds(event["id"])
-        
-        if isinstance(odds_data, dict) and "error" in odds_data:
-            return f"Error fetching odds: {odds_data['error']}"
-        
-        result = "**SUPER BOWL LIVE ODDS - ALL SPORTSBOOKS**\n"
-        result += f"Game: {event.get('away_team')} @ {event.get('home_team')}\n"
-        result += f"Date: {event.get('commence_time', 'TBD')}\n\n"
-        
-        bookmakers = odds_data.get("bookmakers", [])
-        if not bookmakers:
-            return result + "No odds currently available."
-        
-        # Organize by market
-        spreads = []
-        totals = []
-        moneylines = []
-        
-        for book in bookmakers:
-            book_name = book.get("title", "Unknown")
-            for market in book.get("markets", []):
-                mkt_key = market.get("key")
-                outcomes = market.get("outcomes", [])
-                
-                if mkt_key == "spreads":
-                    for o in outcomes:
-                        spreads.append({
-                            "book": book_name,
-                            "team": o.get("name"),
-                            "line": o.get("point"),
-                            "odds": format_odds(o.get("price"))
-                        })
-                elif mkt_key == "totals":
-                    for o in outcomes:
-                        totals.append({
-                            "book": book_name,
-                            "ou": o.get("name"),
-                            "line": o.get("point"),
-                            "odds": format_odds(o.get("price"))
-                        })
-                elif mkt_key == "h2h":
-                    for o in outcomes:
-                        moneylines.append({
-                            "book": book_name,
-                            "team": o.get("name"),
-                            "odds": format_odds(o.get("price"))
-                        })
-        
-        result += "**SPREAD:**\n"
-        for s in spreads[:10]:
-            result += f"  {s['book']}: {s['team']} {s['line']} ({s['odds']})\n"
-        
-        result += "\n**TOTAL (O/U):**\n"
-        for t in totals[:10]:
-            result += f"  {t['book']}: {t['ou']} {t['line']} ({t['odds']})\n"
-        
-        result += "\n**MONEYLINE:**\n"
-        for m in moneylines[:10]:
-            result += f"  {m['book']}: {m['team']} ({m['odds']})\n"
-        
-        return result
+    if not event:
+        return "Unable to find Super Bowl event. The game may not be listed yet."
     
-    elif tool_name == "get_player_props":
-        event = get_super_bowl_event()
-        
-        if not event:
-            return "Unable to find Super Bowl event. Props may not be available yet."
-        
-        prop_type = tool_input.get("prop_type", "all")
-        player_filter = tool_input.get("player_name")
-        
-        # Map categories to markets
-        if prop_type == "all":
-            markets = ALL_PLAYER_PROP_MARKETS
-        elif prop_type in PLAYER_PROP_MARKETS:
-            markets = PLAYER_PROP_MARKETS[prop_type]
-        elif prop_type.startswith("player_"):
+    odds_rows = get_game_odds_rows(event["id"])
+    
+    if isinstance(odds_rows, dict):
+        return f"Error fetching odds: {odds_rows['error']}"
+    
+    parts = ["**SUPER BOWL LIVE ODDS - ALL SPORTSBOOKS**\n"]
+    parts.append(f"Game: {event.get('away_team')} @ {event.get('home_team')}\n")
+    parts.append(f"Date: {event.get('commence_time', 'TBD')}\n\n")
+    
+    if not odds_rows:
+        parts.append("No odds currently available.")
+        return "".join(parts)
+    
+    # Organize by market; only LIVE_ODDS_MAX_ROWS rows per market are shown
+    rows = {mkt_key: [] for mkt_key in GAME_MARKETS}
+    for row in odds_rows:
+        shown = rows.get(row[1])
+        if shown is not None and len(shown) < LIVE_ODDS_MAX_ROWS:
+            shown.append(row)
+    spreads, totals, moneylines = rows["spreads"], rows["totals"], rows["h2h"]
+    
+    parts.append("**SPREAD:**\n")
+    parts.append("".join(f"  {book}: {team} {line} ({format_odds(price)})\n" for book, _, team, line, price in spreads))
+    
+    parts.append("\n**TOTAL (O/U):**\n")
+    parts.append("".join(f"  {book}: {ou} {line} ({format_odds(price)})\n" for book, _, ou, line, price in totals))
+    
+    parts.append("\n**MONEYLINE:**\n")
+    parts.append("".join(f"  {book}: {team} ({format_odds(price)})\n" for book, _, team, _, price in moneylines))
+    
+    return "".join(parts)
+
+
+# prop_type values accepted by get_player_props -> markets to fetch
+PROP_TYPE_MARKETS = {
+    "all": ALL_PLAYER_PROP_MARKETS,
+    **PLAYER_PROP_MARKETS,
+    "pass": PLAYER_PROP_MARKETS["passing"],
+    "rush": PLAYER_PROP_MARKETS["rushing"],
+    "rec": PLAYER_PROP_MARKETS["receiving"],
+    "td": PLAYER_PROP_MARKETS["touchdowns"],
+    "anytime": ["player_anytime_td"],
+    "first": ["player_first_td"],
+}
+
+
+def _tool_get_player_props(tool_input):
+    """Player props for a category or market, injured players excluded."""
+    event = get_super_bowl_event()
+    
+    if not event:
+        return "Unable to find Super Bowl event. Props may not be available yet."
+    
+    prop_type = tool_input.get("prop_type", "all")
+    player_filter = tool_input.get("player_name")
+    
+    # Map categories and common terms to markets; raw market keys pass straight through
+    markets = PROP_TYPE_MARKETS.get(prop_type)
+    if markets is None:
+        if prop_type.startswith("player_"):
             markets = [prop_type]
         else:
-            # Try to map common terms
-            prop_map = {
-                "pass": PLAYER_PROP_MARKETS["passing"],
-                "rush": PLAYER_PROP_MARKETS["rushing"],
-                "rec": PLAYER_PROP_MARKETS["receiving"],
-                "td": PLAYER_PROP_MARKETS["touchdowns"],
-                "anytime": ["player_anytime_td"],
-                "first": ["player_first_td"],
-            }
-            markets = prop_map.get(prop_type.lower(), ALL_PLAYER_PROP_MARKETS)
-        
-        # Fetch props from API
-        props_data = get_all_player_props(event["id"], markets)
-        
-        if not props_data:
-            return f"No {prop_type} props currently available from sportsbooks."
-        
-        # Filter out injured players
-        props_data = filter_injured_players(props_data)
-        
-        # Build response
-        result = f"**SUPER BOWL PLAYER PROPS - {prop_type.upper()}**\n"
-        result += "⚠️ Injured players excluded from recommendations\n"
-        
-        for injured in INJURED_PLAYERS:
-            result += f"🚫 {injured['name']} is {injured['status']} ({injured['injury']})\n"
-        result += "\n"
-        
-        result += format_props_summary(props_data, player_filter)
-        
-        return result
+            markets = PROP_TYPE_MARKETS.get(prop_type.lower(), ALL_PLAYER_PROP_MARKETS)
     
-    elif tool_name == "compare_lines":
-        event = get_super_bowl_event()
-        if not event:
-            return "Unable to find Super Bowl event."
-        
-        player_name = tool_input.get("player_name", "")
-        prop_type = tool_input.get("prop_type", "")
-        
-        # Check if injured
-        if player_name.lower() in INJURED_PLAYER_NAMES:
-            return f"⚠️ {player_name} is INJURED/OUT - DO NOT BET on this player!"
-        
-        props_data = get_all_player_props(event["id"], [prop_type])
-        all_lines = compare_odds_across_books(props_data, prop_type, player_name)
-        
-        if not all_lines:
-            return f"No {prop_type} lines found for {player_name}"
-        
-        result = f"**LINE COMPARISON: {player_name} - {prop_type}**\n\n"
-        result += "| Sportsbook | Line | Over/Under | Odds |\n"
-        result += "|------------|------|------------|------|\n"
-        
-        for line in all_lines:
-            result += f"| {line['book']} | {line['line']} | {line['over_under']} | {line['formatted_odds']} |\n"
-        
-        # Find best
-        overs = [l for l in all_lines if "over" in l['over_under'].lower()]
-        unders = [l for l in all_lines if "under" in l['over_under'].lower()]
-        
-        if overs:
-            best_over = max(overs, key=lambda x: x['odds'])
-            result += f"\n✅ **BEST OVER:** {best_over['book']} at {best_over['line']} ({best_over['formatted_odds']})"
-        if unders:
-            best_under = max(unders, key=lambda x: x['odds'])
-            result += f"\n✅ **BEST UNDER:** {best_under['book']} at {best_under['line']} ({best_under['formatted_odds']})"
-        
-        return result
+    # Fetch props from API
+    props_data = get_all_player_props(event["id"], markets)
     
-    elif tool_name == "get_best_bets":
-        market_type = tool_input.get("market_type", "spread")
-        event = get_super_bowl_event()
-        
-        if market_type in ["spread", "total", "moneyline", "spreads", "totals", "h2h"]:
-            odds_data = get_live_game_odds(event["id"] if event else None)
-            
-            result = f"**BEST LINES - {market_type.upper()}**\n\n"
-            
-            bookmakers = odds_data.get("bookmakers", []) if isinstance(odds_data, dict) else []
-            
-            best_lines = {}
-            for book in bookmakers:
-                book_name = book.get("title")
-                for market in book.get("markets", []):
-                    if market_type.lower() in market.get("key", "").lower():
-                        for outcome in market.get("outcomes", []):
-                            key = f"{outcome.get('name')}_{outcome.get('point', '')}"
-                            odds = outcome.get("price", -99999)
-                            
-                            if key not in best_lines or odds > best_lines[key]["odds"]:
-                                best_lines[key] = {
-                                    "book": book_name,
-                                    "team": outcome.get("name"),
-                                    "line": outcome.get("point"),
-                                    "odds": odds
-                                }
-            
-            for key, data in best_lines.items():
-                result += f"✅ {data['team']}"
-                if data['line']:
-                    result += f" {data['line']}"
-                result += f": {data['book']} ({format_odds(data['odds'])})\n"
-            
-            return result
-        else:
-            # It's a player prop market
-            if event:
-                props_data = get_all_player_props(event["id"], [market_type])
-                props_data = filter_injured_players(props_data)
-                return format_props_summary(props_data)
-            return "Unable to fetch prop data."
+    if not props_data:
+        return f"No {prop_type} props currently available from sportsbooks."
     
-    elif tool_name == "get_team_stats":
-        team = tool_input.get("team", "").lower()
-        
-        if "seahawk" in team or "seattle" in team:
-            team_key = "seahawks"
-        elif "patriot" in team or "new england" in team or "ne" == team:
-            team_key = "patriots"
-        else:
-            return "Please specify 'seahawks' or 'patriots'"
-        
-        t = SUPERBOWL_DATA["teams"][team_key]
-        
-        result = f"**{t['name']}** ({t['record']})\n\n"
-        result += f"**BETTING RECORD:**\n"
-        result += f"• ATS: {t['ats']} ({t['ats_pct']}%)\n"
-        result += f"• O/U: {t['overs']} overs, {t['unders']} unders ({t['over_pct']}% over)\n"
-        result += f"• Home: {t['home_record']} ({t['home_ats']} ATS)\n"
-        result += f"• Road: {t['road_record']} ({t['road_ats']} ATS)\n\n"
-        
-        result += f"**TEAM STATS:**\n"
-        result += f"• PPG: {t['ppg']} scored, {t['ppg_allowed']} allowed\n"
-        result += f"• Yards: {t['avg_yards']}/g ({t['avg_rush_yards']} rush, {t['avg_pass_yards']} pass)\n"
-        result += f"• 3rd Down: {t['third_down_pct']}%\n"
-        result += f"• Turnovers: {t['turnovers_pg']}/game\n\n"
-        
-        result += f"**SCORING BY QUARTER:**\n"
-        s = t['scoring']
-        result += f"• Q1: {s['q1']} | Q2: {s['q2']} | Q3: {s['q3']} | Q4: {s['q4']}\n"
-        result += f"• 1H: {s['first_half']} | 2H: {s['second_half']}\n\n"
-        
-        result += f"**GAME LOG:**\n"
-        for g in SUPERBOWL_DATA["game_logs"][team_key][-10:]:
-            if g["result"] != "-":
-                result += f"Wk {g['wk']}: {g['opp']} {g['result']} | ATS: {g['ats']} | {g['ou']}\n"
-        
-        return result
+    # Build response
+    parts = [f"**SUPER BOWL PLAYER PROPS - {prop_type.upper()}**\n"]
+    parts.append(INJURY_BANNER)
+    parts.append(format_props_summary(props_data, player_filter))
     
-    elif tool_name == "get_player_stats":
-        player_name = tool_input.get("player_name", "").lower()
-        
-        for team_key, players in SUPERBOWL_DATA["players"].items():
-            for player in players:
-                if player_name in player["name"].lower():
-                    is_injured = player.get("status") == "OUT"
-                    
-                    result = f"**{player['name']}** ({player['pos']}) - "
-                    result += f"{SUPERBOWL_DATA['teams'][team_key]['name']}\n\n"
-                    
-                    if is_injured:
-                        result += f"🚫 **STATUS: OUT** - {player.get('injury', 'Injured')}\n"
-                        result += "⚠️ DO NOT BET ON THIS PLAYER\n\n"
-                    
-                    result += f"Games Played: {player.get('games', 'N/A')}\n\n"
-                    
-                    if player["pos"] == "QB":
-                        result += f"**PASSING:**\n"
-                        result += f"• Yards: {player.get('pass_yds', 0):,} ({player['avgs'].get('pass_yds', 0)}/game)\n"
-                        result += f"• TD: {player.get('pass_td', 0)} ({player['avgs'].get('pass_td', 0)}/game)\n"
-                        result += f"• INT: {player.get('pass_int', 0)}\n"
-                        result += f"• Comp%: {player.get('comp_pct', 0)}%\n"
-                        result += f"• Completions/game: {player['avgs'].get('completions', 0)}\n"
-                        result += f"• Attempts/game: {player['avgs'].get('attempts', 0)}\n\n"
-                        result += f"**RUSHING:**\n"
-                        result += f"• Yards: {player.get('rush_yds', 0)} ({player['avgs'].get('rush_yds', 0)}/game)\n"
-                        
-                    elif player["pos"] == "RB":
-                        result += f"**RUSHING:**\n"
-                        result += f"• Yards: {player.get('rush_yds', 0):,} ({player['avgs'].get('rush_yds', 0)}/game)\n"
-                        result += f"• TD: {player.get('rush_td', 0)}\n"
-                        result += f"• Attempts/game: {player['avgs'].get('rush_att', 0)}\n\n"
-                        result += f"**RECEIVING:**\n"
-                        result += f"• Receptions: {player.get('rec', 0)} ({player['avgs'].get('receptions', 0)}/game)\n"
-                        result += f"• Yards: {player.get('rec_yds', 0)} ({player['avgs'].get('rec_yds', 0)}/game)\n"
-                        
-                    elif player["pos"] in ["WR", "TE"]:
-                        result += f"**RECEIVING:**\n"
-                        result += f"• Receptions: {player.get('rec', 0)} ({player['avgs'].get('receptions', 0)}/game)\n"
-                        result += f"• Yards: {player.get('rec_yds', 0):,} ({player['avgs'].get('rec_yds', 0)}/game)\n"
-                        result += f"• TD: {player.get('rec_td', 0)}\n"
-                        result += f"• Targets/game: {player['avgs'].get('targets', 'N/A')}\n"
-                        if player.get('red_zone_targets'):
-                            result += f"• Red Zone Targets: {player['red_zone_targets']}\n"
-                    
-                    if player.get('first_tds'):
-                        result += f"\n• First TDs this season: {player['first_tds']}\n"
-                    
-                    return result
-        
-        return f"Player '{player_name}' not found in database."
+    return "".join(parts)
+
+
+def _tool_compare_lines(tool_input):
+    """Line-shop one player's prop across every book."""
+    event = get_super_bowl_event()
+    if not event:
+        return "Unable to find Super Bowl event."
     
-    elif tool_name == "get_betting_trends":
-        trends = SUPER_BOWL_TRENDS
-        
-        result = "**SUPER BOWL BETTING TRENDS**\n\n"
-        
-        result += "**UNDERDOG ATS:**\n"
-        result += f"• {trends['underdog_ats']['record']}\n"
-        result += f"• Average cover margin: {trends['underdog_ats']['avg_cover']}\n"
-        result += f"• Note: {trends['underdog_ats']['note']}\n\n"
-        
-        result += "**OVER/UNDER:**\n"
-        result += f"• {trends['under_trend']['record']}\n"
-        result += f"• Average total: {trends['under_trend']['avg_total']}\n"
-        result += f"• Note: {trends['under_trend']['note']}\n\n"
-        
-        result += "**FIRST TD SCORER:**\n"
-        result += f"• RBs: {trends['first_td_trends']['running_backs']}\n"
-        result += f"• TEs: {trends['first_td_trends']['tight_ends']}\n"
-        result += f"• {trends['first_td_trends']['note']}\n\n"
-        
-        result += "**REFEREE (Shawn Smith):**\n"
-        result += f"• Underdog record: {trends['referee']['underdogs']}\n"
-        result += f"• Playoff O/U: {trends['referee']['overs']}\n"
-        
-        return result
+    player_name = tool_input.get("player_name", "")
+    prop_type = tool_input.get("prop_type", "")
     
-    elif tool_name == "get_player_game_log":
-        player_name = tool_input.get("player_name", "").lower()
-        
-        # Find matching player in PLAYER_GAME_LOGS
-        matched_player = None
-        for name in PLAYER_GAME_LOGS.keys():
-            if player_name in name.lower() or name.lower() in player_name:
-                matched_player = name
-                break
-            # Handle nicknames
-            if "jsn" in player_name and "smith-njigba" in name.lower():
-                matched_player = name
-                break
-            if "kwiii" in player_name and "walker" in name.lower():
-                matched_player = name
-                break
-        
-        if not matched_player:
-            available = ", ".join(PLAYER_GAME_LOGS.keys())
-            return f"Player '{player_name}' not found. Available players with game logs: {available}"
-        
-        logs = PLAYER_GAME_LOGS[matched_player]
-        
-        # Check if injured
-        is_injured = matched_player.lower() in INJURED_PLAYER_NAMES
-        
-        result = f"**{matched_player} - 2025 Season Game Log**\n"
-        if is_injured:
-            result += "🚫 **STATUS: OUT - Do not include in bet recommendations**\n"
-        result += "\n"
-        
-        for g in logs:
-            wk = g["wk"]
-            opp = g.get("opp", "")
-            result += f"**Week {wk}** vs {opp}\n"
-            if "pass" in g:
-                result += f"  Pass: {g['pass']}\n"
-            if "rush" in g:
-                result += f"  Rush: {g['rush']}\n"
-            if "rec" in g:
-                result += f"  Rec: {g['rec']}\n"
-            result += "\n"
-        
-        return result
+    # Check if injured
+    if player_name.lower() in INJURED_PLAYER_NAMES:
+        return f"⚠️ {player_name} is INJURED/OUT - DO NOT BET on this player!"
     
-    elif tool_name == "get_play_tendencies":
-        team = tool_input.get("team", "").lower()
-        situation = tool_input.get("situation", "")
-        
-        if "seahawk" in team or "seattle" in team:
-            team_key = "seahawks"
-        elif "patriot" in team or "new england" in team:
-            team_key = "patriots"
-        else:
-            return "Please specify 'seahawks' or 'patriots'"
-        
-        t = PLAY_TENDENCIES[team_key]
-        team_name = "Seattle Seahawks" if team_key == "seahawks" else "New England Patriots"
-        
-        result = f"**{team_name} - Play-by-Play Tendencies**\n\n"
-        
-        # Overall
-        result += f"**OVERALL ({t['total_plays']} plays):**\n"
-        result += f"• Run: {t['run_pct']}% ({t['run_plays']} plays)\n"
-        result += f"• Pass: {t['pass_pct']}% ({t['pass_plays']} plays)\n\n"
-        
-        # By Down
-        result += "**BY DOWN:**\n"
-        for down, data in t["by_down"].items():
-            result += f"• {down}: Run {data['run']}%, Pass {data['pass']}% (avg {data['avg_yards']} yds)\n"
-        result += "\n"
-        
-        # Red Zone
-        rz = t["red_zone"]
-        result += f"**RED ZONE ({rz['total_plays']} plays):**\n"
-        result += f"• Run: {rz['run_pct']}%, Pass: {rz['pass_pct']}%\n"
-        result += f"• TD conversion: {rz['td_pct']}%\n\n"
-        
-        # Goal Line
-        gl = t["goal_line"]
-        result += f"**GOAL LINE ({gl['total_plays']} plays):**\n"
-        result += f"• Run: {gl['run_pct']}%, Pass: {gl['pass_pct']}%\n"
-        result += f"• TD conversion: {gl['td_pct']}%\n\n"
-        
-        # Situational
-        sit = t["situational"]
-        result += "**SITUATIONAL:**\n"
-        result += f"• When Trailing: Run {sit['trailing']['run']}%, Pass {sit['trailing']['pass']}%\n"
-        result += f"• When Leading: Run {sit['leading']['run']}%, Pass {sit['leading']['pass']}%\n"
-        result += f"• Close Game (±7): Run {sit['close_game']['run']}%, Pass {sit['close_game']['pass']}%\n\n"
-        
-        # Pass Depth
-        pd = t["pass_depth"]
-        result += f"**PASS DEPTH:**\n"
-        result += f"• Short: {pd['short']}%, Deep: {pd['deep']}%\n\n"
-        
-        # Run Direction
-        rd = t["run_direction"]
-        result += f"**RUN DIRECTION:**\n"
-        result += f"• Left: {rd['left']}%, Middle: {rd['middle']}%, Right: {rd['right']}%\n\n"
-        
-        # Target Share
-        result += "**TARGET SHARE:**\n"
-        for player, share in t["target_share"].items():
-            result += f"• {player}: {share}%\n"
-        result += "\n"
-        
-        # Explosive Plays
-        exp = t["explosive_plays"]
-        result += f"**EXPLOSIVE PLAYS (20+ yards):**\n"
-        result += f"• Total: {exp['total']} (Run: {exp['run_20plus']}, Pass: {exp['pass_20plus']})\n"
-        
-        return result
+    props_data = get_all_player_props(event["id"], [prop_type])
+    all_lines = compare_odds_across_books(props_data, prop_type, player_name)
     
-    elif tool_name == "get_quarter_scoring":
-        team = tool_input.get("team", "").lower()
-        
-        if "both" in team or "compare" in team:
-            # Compare both teams
-            result = "**QUARTER SCORING COMPARISON**\n\n"
-            
-            for team_key in ["seahawks", "patriots"]:
-                team_name = "Seattle Seahawks" if team_key == "seahawks" else "New England Patriots"
-                q = QUARTER_SCORING[team_key]
-                logs = TEAM_GAME_LOGS[team_key]
-                
-                result += f"**{team_name} ({q['games']} games):**\n"
-                result += f"• Scoreless Q1: {q['scoreless_q1']} games ({round(q['scoreless_q1']/q['games']*100, 1)}%)\n"
-                result += f"• Scoreless Q2: {q['scoreless_q2']} games\n"
-                result += f"• Scoreless Q3: {q['scoreless_q3']} games\n"
-                result += f"• Scoreless Q4: {q['scoreless_q4']} games\n"
-                result += f"• Avg Q1: {q['avg_q1']} | Q2: {q['avg_q2']} | Q3: {q['avg_q3']} | Q4: {q['avg_q4']}\n"
-                result += f"• Avg 1st Half: {q['avg_first_half']} | 2nd Half: {q['avg_second_half']}\n\n"
-            
-            return result
-        
-        if "seahawk" in team or "seattle" in team:
-            team_key = "seahawks"
-        elif "patriot" in team or "new england" in team:
-            team_key = "patriots"
-        else:
-            return "Please specify 'seahawks', 'patriots', or 'both'"
-        
-        team_name = "Seattle Seahawks" if team_key == "seahawks" else "New England Patriots"
-        q = QUARTER_SCORING[team_key]
-        logs = TEAM_GAME_LOGS[team_key]
-        
-        result = f"**{team_name} - Quarter-by-Quarter Scoring ({q['games']} games)**\n\n"
-        
-        result += "**SCORELESS QUARTERS:**\n"
-        result += f"• Q1: {q['scoreless_q1']} games ({round(q['scoreless_q1']/q['games']*100, 1)}%)\n"
-        result += f"• Q2: {q['scoreless_q2']} games ({round(q['scoreless_q2']/q['games']*100, 1)}%)\n"
-        result += f"• Q3: {q['scoreless_q3']} games ({round(q['scoreless_q3']/q['games']*100, 1)}%)\n"
-        result += f"• Q4: {q['scoreless_q4']} games ({round(q['scoreless_q4']/q['games']*100, 1)}%)\n"
-        result += f"• Scoreless 1st Half: {q['scoreless_first_half']} games\n"
-        result += f"• Scoreless 2nd Half: {q['scoreless_second_half']} games\n\n"
-        
-        result += "**AVERAGE SCORING:**\n"
-        result += f"• Q1: {q['avg_q1']} pts | Q2: {q['avg_q2']} pts | Q3: {q['avg_q3']} pts | Q4: {q['avg_q4']} pts\n"
-        result += f"• 1st Half: {q['avg_first_half']} pts | 2nd Half: {q['avg_second_half']} pts\n"
-        result += f"• Total: {q['avg_total']} pts/game\n\n"
-        
-        result += "**GAME-BY-GAME BREAKDOWN:**\n"
-        for g in logs:
-            wk = g['wk']
-            venue = "vs" if g['venue'] == 'home' else "@"
-            result += f"Wk {wk}: Q1={g['q1']}, Q2={g['q2']}, Q3={g['q3']}, Q4={g['q4']} (Final: {g['final']})\n"
-        
-        return result
+    if not all_lines:
+        return f"No {prop_type} lines found for {player_name}"
     
-    elif tool_name == "calculate_prop_value":
-        player_name = tool_input.get("player_name", "").lower()
-        stat_type = tool_input.get("stat_type", "")
-        line = tool_input.get("line", 0)
-        book_odds = tool_input.get("book_odds", -110)
-        
-        # Find matching player in PLAYER_GAME_LOGS
-        matched_player = None
-        for name in PLAYER_GAME_LOGS.keys():
-            if player_name in name.lower() or name.lower() in player_name:
-                matched_player = name
-                break
-            # Handle nicknames
-            if "jsn" in player_name and "smith-njigba" in name.lower():
-                matched_player = name
-                break
-            if "kwiii" in player_name and "walker" in name.lower():
-                matched_player = name
-                break
-        
-        if not matched_player:
-            available = ", ".join(PLAYER_GAME_LOGS.keys())
-            return f"Player '{player_name}' not found. Available players: {available}"
-        
-        # Check if injured
-        is_injured = matched_player.lower() in INJURED_PLAYER_NAMES
-        
-        logs = PLAYER_GAME_LOGS[matched_player]
-        analysis = calculate_hit_rate(logs, stat_type, line)
-        
-        if analysis is None or analysis["games"] == 0:
-            return f"No {stat_type} data found for {matched_player}"
-        
-        # Calculate edge vs book odds
-        book_implied = american_to_prob(book_odds) * 100
-        over_edge = analysis["over_pct"] - book_implied
-        under_edge = analysis["under_pct"] - book_implied
-        
-        result = f"**{matched_player} - {stat_type.upper()} Prop Analysis**\n"
-        if is_injured:
-            result += "🚫 **WARNING: Player is OUT - Do not bet**\n"
-        result += f"Line: {line}\n\n"
-        
-        result += f"**HISTORICAL DATA ({analysis['games']} games):**\n"
-        result += f"• Season Average: {analysis['avg']}\n"
-        result += f"• Hit OVER {line}: {analysis['over_count']}/{analysis['games']} times ({analysis['over_pct']}%)\n"
-        result += f"• Hit UNDER {line}: {analysis['under_count']}/{analysis['games']} times ({analysis['under_pct']}%)\n\n"
-        
-        result += f"**TRUE ODDS (based on history):**\n"
-        result += f"• OVER fair odds: {format_american_odds(analysis['over_fair_odds'])}\n"
-        result += f"• UNDER fair odds: {format_american_odds(analysis['under_fair_odds'])}\n\n"
-        
-        result += f"**VALUE ANALYSIS vs {format_american_odds(book_odds)} ({book_implied:.1f}% implied):**\n"
-        
-        if over_edge > 5:
-            result += f"✅ **OVER has VALUE**: +{over_edge:.1f}% edge\n"
-            result += f"   True prob {analysis['over_pct']}% vs implied {book_implied:.1f}%\n"
-        elif over_edge < -5:
-            result += f"❌ OVER is BAD: {over_edge:.1f}% edge (avoid)\n"
-        else:
-            result += f"⚖️ OVER is FAIR: {over_edge:+.1f}% edge\n"
-        
-        if under_edge > 5:
-            result += f"✅ **UNDER has VALUE**: +{under_edge:.1f}% edge\n"
-            result += f"   True prob {analysis['under_pct']}% vs implied {book_implied:.1f}%\n"
-        elif under_edge < -5:
-            result += f"❌ UNDER is BAD: {under_edge:.1f}% edge (avoid)\n"
-        else:
-            result += f"⚖️ UNDER is FAIR: {under_edge:+.1f}% edge\n"
-        
-        # Show recent trend (last 5 games)
-        recent_values = analysis["values"][-5:] if len(analysis["values"]) >= 5 else analysis["values"]
-        recent_over = sum(1 for v in recent_values if v > line)
-        result += f"\n**RECENT TREND (last {len(recent_values)} games):**\n"
-        result += f"• Values: {recent_values}\n"
-        result += f"• Over {line}: {recent_over}/{len(recent_values)} times\n"
-        
-        return result
+    parts = [f"**LINE COMPARISON: {player_name} - {prop_type}**\n\n"]
+    parts.append(COMPARE_LINES_HEADER)
     
-    elif tool_name == "find_value_props":
-        stat_type = tool_input.get("stat_type", "all").lower()
-        min_edge = tool_input.get("min_edge", 10)
-        
-        # Define common prop lines to check
-        prop_lines = {
-            "pass_yds": [199.5, 224.5, 249.5, 274.5, 299.5],
-            "pass_tds": [0.5, 1.5, 2.5],
-            "completions": [17.5, 19.5, 21.5, 23.5],
-            "rush_yds": [39.5, 49.5, 59.5, 69.5, 79.5],
-            "receptions": [3.5, 4.5, 5.5, 6.5, 7.5],
-            "rec_yds": [49.5, 59.5, 69.5, 79.5, 99.5],
-        }
-        
-        if stat_type == "all":
-            stats_to_check = list(prop_lines.keys())
-        else:
-            stats_to_check = [stat_type] if stat_type in prop_lines else []
+    parts.append("".join(
+        f"| {line['book']} | {line['line']} | {line['over_under']} | {line['formatted_odds']} |\n"
+        for line in all_lines
+    ))
+    
+    # Find best - all_lines is sorted best odds first, so take the first of each side
+    best_over = best_under = None
+    for line in all_lines:
+        side = line['over_under'].lower()
+        if best_over is None and "over" in side:
+            best_over = line
+        elif best_under is None and "under" in side:
+            best_under = line
+    
+    if best_over:
+        parts.append(f"\n✅ **BEST OVER:** {best_over['book']} at {best_over['line']} ({best_over['formatted_odds']})")
+    if best_under:
+        parts.append(f"\n✅ **BEST UNDER:** {best_under['book']} at {best_under['line']} ({best_under['formatted_odds']})")
+    
+    return "".join(parts)
+
+
+def _tool_get_best_bets(tool_input):
+    """Best available price per side for a game or prop market."""
+    market_type = tool_input.get("market_type", "spread")
+    event = get_super_bowl_event()
+    
+    if market_type in ["spread", "total", "moneyline", "spreads", "totals", "h2h"]:
+        odds_rows = get_game_odds_rows(event["id"]) if event else ()
         
-        if not stats_to_check:
-            return f"Unknown stat type: {stat_type}. Available: {', '.join(prop_lines.keys())}"
+        parts = [f"**BEST LINES - {market_type.upper()}**\n\n"]
         
-        book_implied = american_to_prob(-110) * 100
-        value_props = []
+        if isinstance(odds_rows, dict):
+            odds_rows = ()
         
-        for player_name, logs in PLAYER_GAME_LOGS.items():
-            # Skip injured players
-            if player_name.lower() in INJURED_PLAYER_NAMES:
+        best_lines = {}
+        market_type_lower = market_type.lower()
+        for book_name, mkt_key, name, point, price in odds_rows:
+            if market_type_lower not in (mkt_key or "").lower():
                 continue
+            key = (name, point)
+            odds = -99999 if price is None else price
             
-            for stat in stats_to_check:
-                for line in prop_lines.get(stat, []):
-                    analysis = calculate_hit_rate(logs, stat, line)
-                    if analysis is None or analysis["games"] < 5:
-                        continue
-                    
-                    over_edge = analysis["over_pct"] - book_implied
-                    under_edge = analysis["under_pct"] - book_implied
-                    
-                    if over_edge >= min_edge:
-                        value_props.append({
-                            "player": player_name,
-                            "stat": stat,
-                            "line": line,
-                            "side": "OVER",
-                            "hit_rate": analysis["over_pct"],
-                            "edge": over_edge,
-                            "fair_odds": analysis["over_fair_odds"],
-                            "games": analysis["games"],
-                            "avg": analysis["avg"]
-                        })
-                    
-                    if under_edge >= min_edge:
-                        value_props.append({
-                            "player": player_name,
-                            "stat": stat,
-                            "line": line,
-                            "side": "UNDER",
-                            "hit_rate": analysis["under_pct"],
-                            "edge": under_edge,
-                            "fair_odds": analysis["under_fair_odds"],
-                            "games": analysis["games"],
-                            "avg": analysis["avg"]
-                        })
-        
-        # Sort by edge
-        value_props.sort(key=lambda x: x["edge"], reverse=True)
-        
-        result = f"**VALUE PROPS FINDER** (min edge: {min_edge}%)\n"
-        result += f"Comparing historical data vs -110 odds ({book_implied:.1f}% implied)\n\n"
-        
-        if not value_props:
-            result += "No significant value found at current lines.\n"
-            return result
-        
-        result += f"**Found {len(value_props)} value opportunities:**\n\n"
-        
-        for prop in value_props[:15]:  # Top 15
-            result += f"**{prop['player']}** - {prop['stat'].replace('_', ' ').title()}\n"
-            result += f"  {prop['side']} {prop['line']}: {prop['hit_rate']}% hit rate ({prop['edge']:+.1f}% edge)\n"
-            result += f"  Fair odds: {format_american_odds(prop['fair_odds'])} | Avg: {prop['avg']} | Games: {prop['games']}\n\n"
+            # (odds, book) per (team, line); a tuple keeps the scan allocation-light
+            current = best_lines.get(key)
+            if current is None or odds > current[0]:
+                best_lines[key] = (odds, book_name)
+        
+        for (team, line), (odds, book_name) in best_lines.items():
+            parts.append(f"✅ {team}")
+            if line:
+                parts.append(f" {line}")
+            parts.append(f": {book_name} ({format_odds(odds)})\n")
+        
+        return "".join(parts)
+    else:
+        # It's a player prop market
+        if event:
+            props_data = get_all_player_props(event["id"], [market_type])
+            return format_props_summary(props_data)
+        return "Unable to fetch prop data."
+
+
+def _tool_get_team_stats(tool_input):
+    """Season stats, betting record and recent games for a team."""
+    team_key = resolve_team_key(tool_input.get("team", ""))
+    if not team_key:
+        return "Please specify 'seahawks' or 'patriots'"
+    
+    return TEAM_STATS_REPORTS[team_key]
+
+
+def _tool_get_player_stats(tool_input):
+    """Season stats and per-game averages for a player."""
+    player_name = tool_input.get("player_name", "").lower()
+    
+    # Full names and single name tokens resolve via the index; anything else falls back to a scan
+    row = PLAYER_INDEX.get(player_name) or next((row for row in ROSTER if player_name in row[1]), None)
+    if row:
+        return PLAYER_STATS_REPORTS[row[1]]
+    
+    return f"Player '{player_name}' not found in database."
+
+
+def _tool_get_betting_trends(tool_input):
+    """Historical Super Bowl betting trends."""
+    return BETTING_TRENDS_REPORT
+
+
+def _tool_get_player_game_log(tool_input):
+    """Week-by-week stat lines for a player."""
+    player_name = tool_input.get("player_name", "").lower()
+    
+    matched_player = find_game_log_player(player_name)
+    
+    if not matched_player:
+        return f"Player '{player_name}' not found. Available players with game logs: {GAME_LOG_PLAYERS}"
+    
+    logs = PLAYER_GAME_LOGS[matched_player]
+    
+    # Check if injured
+    is_injured = matched_player.lower() in INJURED_PLAYER_NAMES
+    
+    parts = [f"**{matched_player} - 2025 Season Game Log**\n"]
+    if is_injured:
+        parts.append("🚫 **STATUS: OUT - Do not include in bet recommendations**\n")
+    parts.append("\n")
+    
+    parts.append("".join(map(format_game_log_entry, logs)))
+    
+    return "".join(parts)
+
+
+def _tool_get_play_tendencies(tool_input):
+    """Play-calling tendencies for a team."""
+    team_key = resolve_team_key(tool_input.get("team", ""))
+    situation = tool_input.get("situation", "")
+    
+    if not team_key:
+        return "Please specify 'seahawks' or 'patriots'"
+    
+    return PLAY_TENDENCY_REPORTS[team_key]
+
+
+def _tool_get_quarter_scoring(tool_input):
+    """Quarter and half scoring for one or both teams."""
+    team = tool_input.get("team", "").lower()
+    
+    if "both" in team or "compare" in team:
+        # Compare both teams
+        parts = ["**QUARTER SCORING COMPARISON**\n\n"]
+        
+        for team_key in ["seahawks", "patriots"]:
+            team_name = "Seattle Seahawks" if team_key == "seahawks" else "New England Patriots"
+            q = QUARTER_SCORING[team_key]
+            logs = TEAM_GAME_LOGS[team_key]
+            
+            parts.append(f"**{team_name} ({q['games']} games):**\n")
+            parts.append(f"• Scoreless Q1: {q['scoreless_q1']} games ({round(q['scoreless_q1']/q['games']*100, 1)}%)\n")
+            parts.append(f"• Scoreless Q2: {q['scoreless_q2']} games\n")
+            parts.append(f"• Scoreless Q3: {q['scoreless_q3']} games\n")
+            parts.append(f"• Scoreless Q4: {q['scoreless_q4']} games\n")
+            parts.append(f"• Avg Q1: {q['avg_q1']} | Q2: {q['avg_q2']} | Q3: {q['avg_q3']} | Q4: {q['avg_q4']}\n")
+            parts.append(f"• Avg 1st Half: {q['avg_first_half']} | 2nd Half: {q['avg_second_half']}\n\n")
+        
+        return "".join(parts)
+    
+    team_key = resolve_team_key(team)
+    if not team_key:
+        return "Please specify 'seahawks', 'patriots', or 'both'"
+    
+    team_name = "Seattle Seahawks" if team_key == "seahawks" else "New England Patriots"
+    q = QUARTER_SCORING[team_key]
+    logs = TEAM_GAME_LOGS[team_key]
+    
+    parts = [f"**{team_name} - Quarter-by-Quarter Scoring ({q['games']} games)**\n\n"]
+    
+    parts.append("**SCORELESS QUARTERS:**\n")
+    parts.append(f"• Q1: {q['scoreless_q1']} games ({round(q['scoreless_q1']/q['games']*100, 1)}%)\n")
+    parts.append(f"• Q2: {q['scoreless_q2']} games ({round(q['scoreless_q2']/q['games']*100, 1)}%)\n")
+    parts.append(f"• Q3: {q['scoreless_q3']} games ({round(q['scoreless_q3']/q['games']*100, 1)}%)\n")
+    parts.append(f"• Q4: {q['scoreless_q4']} games ({round(q['scoreless_q4']/q['games']*100, 1)}%)\n")
+    parts.append(f"• Scoreless 1st Half: {q['scoreless_first_half']} games\n")
+    parts.append(f"• Scoreless 2nd Half: {q['scoreless_second_half']} games\n\n")
+    
+    parts.append("**AVERAGE SCORING:**\n")
+    parts.append(f"• Q1: {q['avg_q1']} pts | Q2: {q['avg_q2']} pts | Q3: {q['avg_q3']} pts | Q4: {q['avg_q4']} pts\n")
+    parts.append(f"• 1st Half: {q['avg_first_half']} pts | 2nd Half: {q['avg_second_half']} pts\n")
+    parts.append(f"• Total: {q['avg_total']} pts/game\n\n")
+    
+    parts.append("**GAME-BY-GAME BREAKDOWN:**\n")
+    for g in logs:
+        wk = g['wk']
+        venue = "vs" if g['venue'] == 'home' else "@"
+        parts.append(f"Wk {wk}: Q1={g['q1']}, Q2={g['q2']}, Q3={g['q3']}, Q4={g['q4']} (Final: {g['final']})\n")
+    
+    return "".join(parts)
+
+
+def _tool_calculate_prop_value(tool_input):
+    """Historical hit rate and edge for a prop line vs the book price."""
+    player_name = tool_input.get("player_name", "").lower()
+    stat_type = tool_input.get("stat_type", "")
+    line = tool_input.get("line", 0)
+    book_odds = tool_input.get("book_odds", -110)
+    
+    matched_player = find_game_log_player(player_name)
+    
+    if not matched_player:
+        return f"Player '{player_name}' not found. Available players: {GAME_LOG_PLAYERS}"
+    
+    # Check if injured
+    is_injured = matched_player.lower() in INJURED_PLAYER_NAMES
+    
+    analysis = calculate_hit_rate(matched_player, stat_type, line)
+    
+    if analysis is None or analysis["games"] == 0:
+        return f"No {stat_type} data found for {matched_player}"
+    
+    # Calculate edge vs book odds
+    book_implied = american_to_prob(book_odds) * 100
+    over_edge = analysis["over_pct"] - book_implied
+    under_edge = analysis["under_pct"] - book_implied
+    
+    parts = [f"**{matched_player} - {stat_type.upper()} Prop Analysis**\n"]
+    if is_injured:
+        parts.append("🚫 **WARNING: Player is OUT - Do not bet**\n")
+    parts.append(f"Line: {line}\n\n")
+    
+    parts.append(f"**HISTORICAL DATA ({analysis['games']} games):**\n")
+    parts.append(f"• Season Average: {analysis['avg']}\n")
+    parts.append(f"• Hit OVER {line}: {analysis['over_count']}/{analysis['games']} times ({analysis['over_pct']}%)\n")
+    parts.append(f"• Hit UNDER {line}: {analysis['under_count']}/{analysis['games']} times ({analysis['under_pct']}%)\n\n")
+    
+    parts.append(f"**TRUE ODDS (based on history):**\n")
+    parts.append(f"• OVER fair odds: {format_american_odds(analysis['over_fair_odds'])}\n")
+    parts.append(f"• UNDER fair odds: {format_american_odds(analysis['under_fair_odds'])}\n\n")
+    
+    parts.append(f"**VALUE ANALYSIS vs {format_american_odds(book_odds)} ({book_implied:.1f}% implied):**\n")
+    
+    if over_edge > 5:
+        parts.append(f"✅ **OVER has VALUE**: +{over_edge:.1f}% edge\n")
+        parts.append(f"   True prob {analysis['over_pct']}% vs implied {book_implied:.1f}%\n")
+    elif over_edge < -5:
+        parts.append(f"❌ OVER is BAD: {over_edge:.1f}% edge (avoid)\n")
+    else:
+        parts.append(f"⚖️ OVER is FAIR: {over_edge:+.1f}% edge\n")
+    
+    if under_edge > 5:
+        parts.append(f"✅ **UNDER has VALUE**: +{under_edge:.1f}% edge\n")
+        parts.append(f"   True prob {analysis['under_pct']}% vs implied {book_implied:.1f}%\n")
+    elif under_edge < -5:
+        parts.append(f"❌ UNDER is BAD: {under_edge:.1f}% edge (avoid)\n")
+    else:
+        parts.append(f"⚖️ UNDER is FAIR: {under_edge:+.1f}% edge\n")
+    
+    # Show recent trend (last 5 games)
+    recent_values = analysis["values"][-5:].tolist()
+    recent_over = sum(1 for v in recent_values if v > line)
+    parts.append(f"\n**RECENT TREND (last {len(recent_values)} games):**\n")
+    parts.append(f"• Values: {recent_values}\n")
+    parts.append(f"• Over {line}: {recent_over}/{len(recent_values)} times\n")
+    
+    return "".join(parts)
+
+
+def _tool_find_value_props(tool_input):
+    """Scan every player for +EV props at common lines."""
+    stat_type = tool_input.get("stat_type", "all").lower()
+    min_edge = tool_input.get("min_edge", 10)
+    
+    # Define common prop lines to check
+    prop_lines = {
+        "pass_yds": [199.5, 224.5, 249.5, 274.5, 299.5],
+        "pass_tds": [0.5, 1.5, 2.5],
+        "completions": [17.5, 19.5, 21.5, 23.5],
+        "rush_yds": [39.5, 49.5, 59.5, 69.5, 79.5],
+        "receptions": [3.5, 4.5, 5.5, 6.5, 7.5],
+        "rec_yds": [49.5, 59.5, 69.5, 79.5, 99.5],
+    }
+    
+    if stat_type == "all":
+        stats_to_check = list(prop_lines.keys())
+    else:
+        stats_to_check = [stat_type] if stat_type in prop_lines else []
+    
+    if not stats_to_check:
+        return f"Unknown stat type: {stat_type}. Available: {', '.join(prop_lines.keys())}"
+    
+    book_implied = american_to_prob(-110) * 100
+    value_props = []
+    
+    for player_name in PLAYER_GAME_LOGS:
+        # Skip injured players
+        if player_name.lower() in INJURED_PLAYER_NAMES:
+            continue
         
-        return result
+        for stat in stats_to_check:
+            for line in prop_lines.get(stat, []):
+                analysis = calculate_hit_rate(player_name, stat, line)
+                if analysis is None or analysis["games"] < 5:
+                    continue
+                
+                over_edge = analysis["over_pct"] - book_implied
+                under_edge = analysis["under_pct"] - book_implied
+                
+                if over_edge >= min_edge:
+                    value_props.append({
+                        "player": player_name,
+                        "stat": stat,
+                        "line": line,
+                        "side": "OVER",
+                        "hit_rate": analysis["over_pct"],
+                        "edge": over_edge,
+                        "fair_odds": analysis["over_fair_odds"],
+                        "games": analysis["games"],
+                        "avg": analysis["avg"]
+                    })
+                
+                if under_edge >= min_edge:
+                    value_props.append({
+                        "player": player_name,
+                        "stat": stat,
+                        "line": line,
+                        "side": "UNDER",
+                        "hit_rate": analysis["under_pct"],
+                        "edge": under_edge,
+                        "fair_odds": analysis["under_fair_odds"],
+                        "games": analysis["games"],
+                        "avg": analysis["avg"]
+                    })
+    
+    # Sort by edge
+    value_props.sort(key=itemgetter("edge"), reverse=True)
     
-    return f"Unknown tool: {tool_name}"
+    parts = [f"**VALUE PROPS FINDER** (min edge: {min_edge}%)\n"]
+    parts.append(f"Comparing historical data vs -110 odds ({book_implied:.1f}% implied)\n\n")
+    
+    if not value_props:
+        parts.append("No significant value found at current lines.\n")
+        return "".join(parts)
+    
+    parts.append(f"**Found {len(value_props)} value opportunities:**\n\n")
+    
+    for prop in value_props[:15]:  # Top 15
+        parts.append(f"**{prop['player']}** - {prop['stat'].replace('_', ' ').title()}\n")
+        parts.append(f"  {prop['side']} {prop['line']}: {prop['hit_rate']}% hit rate ({prop['edge']:+.1f}% edge)\n")
+        parts.append(f"  Fair odds: {format_american_odds(prop['fair_odds'])} | Avg: {prop['avg']} | Games: {prop['games']}\n\n")
+    
+    return "".join(parts)
+
+
+# Tool name -> handler
+TOOL_HANDLERS = {
+    "get_live_game_odds": _tool_get_live_game_odds,
+    "get_player_props": _tool_get_player_props,
+    "compare_lines": _tool_compare_lines,
+    "get_best_bets": _tool_get_best_bets,
+    "get_team_stats": _tool_get_team_stats,
+    "get_player_stats": _tool_get_player_stats,
+    "get_betting_trends": _tool_get_betting_trends,
+    "get_player_game_log": _tool_get_player_game_log,
+    "get_play_tendencies": _tool_get_play_tendencies,
+    "get_quarter_scoring": _tool_get_quarter_scoring,
+    "calculate_prop_value": _tool_calculate_prop_value,
+    "find_value_props": _tool_find_value_props,
+}
+
+
+def execute_tool(tool_name, tool_input):
+    """Execute a tool and return results."""
+    tool_handler = TOOL_HANDLERS.get(tool_name)
+    if tool_handler is None:
+        return f"Unknown tool: {tool_name}"
+    return tool_handler(tool_input)
 
 
 # ============================================
 # SYSTEM PROMPT
 # ============================================
 
+# Per-game averages shown for each position in the prompt's KEY PLAYERS list
+KEY_PLAYER_TEMPLATES = {
+    "QB": "Pass {pass_yds}/g, {pass_td} TD/g",
+    "RB": "Rush {rush_yds}/g, Rec {receptions}/g",
+}
+KEY_PLAYER_DEFAULT_TEMPLATE = "Rec {receptions}/g, {rec_yds} yds/g"
+
+
+def format_key_players(players):
+    """KEY PLAYERS lines for the system prompt, with injured players flagged."""
+    return "\n".join(
+        f"• {pl['name']} ({pl['pos']}): "
+        + KEY_PLAYER_TEMPLATES.get(pl["pos"], KEY_PLAYER_DEFAULT_TEMPLATE).format_map(defaultdict(int, pl["avgs"]))
+        + (" 🚫 OUT" if pl.get("status") == "OUT" else "")
+        for pl in players
+    )
+
+
+# Built from static season data, so it only needs rendering once
+@lru_cache(maxsize=1)
 def get_system_prompt():
     s = SUPERBOWL_DATA["teams"]["seahawks"]
     p = SUPERBOWL_DATA["teams"]["patriots"]
     
-    seahawks_players = "\n".join([
-        f"• {pl['name']} ({pl['pos']}): " + 
-        (f"Pass {pl['avgs'].get('pass_yds', 0)}/g, {pl['avgs'].get('pass_td', 0)} TD/g" if pl['pos'] == 'QB' else
-         f"Rush {pl['avgs'].get('rush_yds', 0)}/g, Rec {pl['avgs'].get('receptions', 0)}/g" if pl['pos'] == 'RB' else
-         f"Rec {pl['avgs'].get('receptions', 0)}/g, {pl['avgs'].get('rec_yds', 0)} yds/g") +
-        (" 🚫 OUT" if pl.get('status') == 'OUT' else "")
-        for pl in SUPERBOWL_DATA["players"]["seahawks"]
-    ])
-    
-    patriots_players = "\n".join([
-        f"• {pl['name']} ({pl['pos']}): " +
-        (f"Pass {pl['avgs'].get('pass_yds', 0)}/g, {pl['avgs'].get('pass_td', 0)} TD/g" if pl['pos'] == 'QB' else
-         f"Rush {pl['avgs'].get('rush_yds', 0)}/g, Rec {pl['avgs'].get('receptions', 0)}/g" if pl['pos'] == 'RB' else
-         f"Rec {pl['avgs'].get('receptions', 0)}/g, {pl['avgs'].get('rec_yds', 0)} yds/g")
-        for pl in SUPERBOWL_DATA["players"]["patriots"]
-    ])
+    seahawks_players = format_key_players(SUPERBOWL_DATA["players"]["seahawks"])
+    patriots_players = format_key_players(SUPERBOWL_DATA["players"]["patriots"])
     
     return f"""You are the BettorDay AI betting analyst for Super Bowl LIX: Seattle Seahawks vs New England Patriots.
 
@@ -2186,15 +2467,37 @@ You're a veteran analyst. Be specific, cite data, and help users find value!"""
 # VERCEL HANDLER
 # ============================================
 
+@lru_cache(maxsize=1)
+def get_anthropic_client():
+    """Shared Anthropic client, created on first use so its connections are reused."""
+    return anthropic.Anthropic()
+
+
+# Largest chat request body accepted (message plus recent history)
+MAX_REQUEST_BODY_BYTES = 256 * 1024
+
+# Prior chat messages forwarded to the model with each request
+MAX_HISTORY_MESSAGES = 20
+
+# Model round trips allowed for tool calls in one chat request
+MAX_TOOL_ITERATIONS = 8
+TOOL_LIMIT_NOTICE = "I hit the limit on data lookups for one question. Try asking about one market or player at a time."
+
+
 class handler(BaseHTTPRequestHandler):
+    def _send_json(self, status, payload, indent=None):
+        """Serialize payload and send it as one JSON response with a Content-Length."""
+        body = json.dumps(payload, indent=indent).encode()
+        self.send_response(status)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(body)
+    
     def do_GET(self):
         """Test endpoint - check API connectivity"""
         try:
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
             # Test The Odds API connection
             test_result = {
                 "status": "ok",
@@ -2214,105 +2517,102 @@ class handler(BaseHTTPRequestHandler):
                 
                 # Try to find Super Bowl
                 sb = get_super_bowl_event()
+                test_result["super_bowl_found"] = bool(sb)
                 if sb:
-                    test_result["super_bowl_found"] = True
                     test_result["super_bowl_id"] = sb.get("id")
                     test_result["matchup"] = f"{sb.get('away_team')} @ {sb.get('home_team')}"
-                else:
-                    test_result["super_bowl_found"] = False
             
-            self.wfile.write(json.dumps(test_result, indent=2).encode())
+            # Compact on the wire; ?pretty=1 for a readable dump
+            pretty = parse_qs(urlsplit(self.path).query).get("pretty") == ["1"]
+            self._send_json(200, test_result, indent=2 if pretty else None)
             
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({"error": str(e)}).encode())
+            self._send_json(500, {"error": str(e)})
     
     def do_POST(self):
         try:
-            content_length = int(self.headers['Content-Length'])
+            content_length = int(self.headers.get('Content-Length') or 0)
+            if content_length > MAX_REQUEST_BODY_BYTES:
+                self._send_json(413, {
+                    "success": False,
+                    "error": "Request body too large"
+                })
+                return
             post_data = self.rfile.read(content_length)
-            body = json.loads(post_data.decode('utf-8'))
+            body = json.loads(post_data)
             
             user_message = body.get('message', '')
             conversation_history = body.get('history', [])
             
-            client = anthropic.Anthropic()
+            client = get_anthropic_client()
+            
+            # Keep only the recent window, starting on a user turn as the API requires
+            history = conversation_history[-MAX_HISTORY_MESSAGES:]
+            while history and history[0].get("role") != "user":
+                history = history[1:]
+            messages = history + [{"role": "user", "content": user_message}]
             
-            messages = conversation_history + [{"role": "user", "content": user_message}]
+            # Same prompt for every round trip of the tool-use loop; the cache
+            # breakpoint lets the API reuse the tools + system prefix across calls
+            system_prompt = [{
+                "type": "text",
+                "text": get_system_prompt(),
+                "cache_control": {"type": "ephemeral"}
+            }]
             
             # Initial API call
             response = client.messages.create(
                 model="claude-sonnet-4-20250514",
                 max_tokens=4096,
-                system=get_system_prompt(),
+                system=system_prompt,
                 tools=TOOLS,
                 messages=messages
             )
             
-            # Handle tool use loop
-            while response.stop_reason == "tool_use":
-                tool_results = []
+            # Handle tool use loop, bounded so a runaway loop can't resend the transcript forever
+            tool_rounds = 0
+            while response.stop_reason == "tool_use" and tool_rounds < MAX_TOOL_ITERATIONS:
+                tool_rounds += 1
+                # The SDK accepts its own content blocks back, so the assistant turn is resent as-is
+                tool_blocks = [block for block in response.content if block.type == "tool_use"]
                 
-                # Convert assistant content to serializable format
-                assistant_content_serializable = []
-                for block in response.content:
-                    if block.type == "tool_use":
-                        tool_result = execute_tool(block.name, block.input)
-                        tool_results.append({
-                            "type": "tool_result",
-                            "tool_use_id": block.id,
-                            "content": tool_result
-                        })
-                        assistant_content_serializable.append({
-                            "type": "tool_use",
-                            "id": block.id,
-                            "name": block.name,
-                            "input": block.input
-                        })
-                    elif hasattr(block, 'text'):
-                        assistant_content_serializable.append({
-                            "type": "text",
-                            "text": block.text
-                        })
+                # Run this turn's tool calls concurrently; results keep block order
+                tool_outputs = TOOL_POOL.map(lambda block: execute_tool(block.name, block.input), tool_blocks)
+                tool_results = [
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": block.id,
+                        "content": tool_result
+                    }
+                    for block, tool_result in zip(tool_blocks, tool_outputs)
+                ]
                 
-                messages.append({"role": "assistant", "content": assistant_content_serializable})
+                messages.append({"role": "assistant", "content": response.content})
                 messages.append({"role": "user", "content": tool_results})
                 
                 response = client.messages.create(
                     model="claude-sonnet-4-20250514",
                     max_tokens=4096,
-                    system=get_system_prompt(),
+                    system=system_prompt,
                     tools=TOOLS,
                     messages=messages
                 )
             
             # Extract final text response
-            final_response = ""
-            for block in response.content:
-                if hasattr(block, 'text'):
-                    final_response += block.text
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
+            final_response = "".join(block.text for block in response.content if block.type == "text")
+            if response.stop_reason == "tool_use":
+                final_response = "\n\n".join(filter(None, [final_response, TOOL_LIMIT_NOTICE]))
             
-            self.wfile.write(json.dumps({
+            self._send_json(200, {
                 "success": True,
                 "response": final_response
-            }).encode())
+            })
             
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps({
+            self._send_json(500, {
                 "success": False,
                 "error": str(e)
-            }).encode())
+            })
     
     def do_OPTIONS(self):
         self.send_response(200)